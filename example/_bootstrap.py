@@ -0,0 +1,24 @@
+"""
+Shared bootstrap for the example scripts.
+
+Puts the project's ``lib`` directory on ``sys.path`` and loads ``.env``
+exactly once per process, no matter how many example modules import it.
+"""
+
+import os
+import sys
+
+_LIB_PATH = os.path.join(os.path.dirname(__file__), "..", "lib")
+if _LIB_PATH not in sys.path:
+    sys.path.insert(0, _LIB_PATH)
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    # dotenv is optional; environment variables can be set directly
+    pass
+else:
+    load_dotenv()
+
+# Sentinel so repeat imports are free module-cache hits
+_DONE = True
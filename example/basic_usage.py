@@ -7,18 +7,12 @@ Demonstrates how to use the ShadowAI library to generate various types of mock d
 import os
 import sys
 
-from dotenv import load_dotenv
-
-# Add project root directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
-
+import _bootstrap  # noqa: F401  (sys.path and .env setup, shared by all examples)
 from shadow_ai import Rule, RuleCombination, RulePackage, ShadowAI
 from shadow_ai.rules import age_rule, email_rule, first_name_rule, last_name_rule
 from shadow_ai.rules.combinations import full_name_combination
 from shadow_ai.rules.packages import person_package
 
-load_dotenv()
-
 
 def main():
     """Main function demonstrating various usage patterns"""
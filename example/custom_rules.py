@@ -7,9 +7,7 @@ Demonstrates how to create and use custom rules.
 import os
 import sys
 
-# Add project root directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
-
+import _bootstrap  # noqa: F401  (sys.path and .env setup, shared by all examples)
 from shadow_ai import Rule, RuleCombination, RulePackage, ShadowAI
 
 
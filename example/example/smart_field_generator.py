@@ -1,39 +1,121 @@
+import asyncio
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import make_dataclass
+from functools import lru_cache, partial
 from typing import Dict, List, Any
 
-from dotenv import load_dotenv
-from faker import Faker
 from shadow_ai import ShadowAI, Rule
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, numeric columns fall back to Faker
+    np = None
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # orjson is optional, fall back to stdlib json
+    # Reuse one encoder instead of letting json.dumps build one per call
+    _dumps = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+class RateLimiter:
+    """Simple asyncio token-bucket limiter (requests per minute)"""
+
+    def __init__(self, rpm: int = 60):
+        self.rpm = rpm
+        self._interval = 60.0 / rpm
+        self._next_slot = 0.0
+        # Created per event loop: on Python < 3.10 asyncio primitives bind
+        # the loop at construction, and one limiter may outlive several
+        # asyncio.run calls
+        self._lock = None
+        self._lock_loop = None
+
+    async def acquire(self):
+        """Wait until a request slot is available"""
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._lock:
+            now = asyncio.get_event_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
 
 class SmartFieldGenerator:
     """Smart Field Generator - Field-level mixed strategy"""
 
-    def __init__(self, locale='en_US'):
+    def __init__(self, locale='en_US', max_concurrency: int = 10, rpm: int = None, dedupe: bool = False):
+        # Deferred import: Faker loads its provider modules on first use only
+        from faker import Faker
+
         self.shadow_ai = ShadowAI()
         self.faker = Faker(locale)
-
-        # Predefined Faker generator mapping
+        # Bound concurrent AI calls to avoid provider rate-limit (429) storms.
+        # The semaphore is created per event loop inside _agenerate_limited
+        # for the same loop-binding reason as RateLimiter's lock
+        self._max_concurrency = max_concurrency
+        self._sem = None
+        self._sem_loop = None
+        self._limiter = RateLimiter(rpm) if rpm else None
+
+        # Bind the underlying RNG method once to skip per-call attribute walks
+        self._uniform = self.faker.random.uniform
+
+        # Predefined Faker generator mapping (bound methods, no lambda frames)
+        faker = self.faker
         self.faker_generators = {
-            'name': lambda: self.faker.name(),
-            'first_name': lambda: self.faker.first_name(),
-            'last_name': lambda: self.faker.last_name(),
-            'email': lambda: self.faker.email(),
-            'phone': lambda: self.faker.phone_number(),
-            'address': lambda: self.faker.address(),
-            'company': lambda: self.faker.company(),
-            'job_title': lambda: self.faker.job(),
-            'age': lambda: self.faker.random_int(18, 80),
-            'date': lambda: self.faker.date(),
-            'url': lambda: self.faker.url(),
-            'username': lambda: self.faker.user_name(),
-            'price': lambda: round(self.faker.random.uniform(10, 1000), 2),
-            'quantity': lambda: self.faker.random_int(1, 100),
-            'id': lambda: self.faker.uuid4(),
-            'rating': lambda: self.faker.random_int(1, 5),  # Add rating
+            'name': faker.name,
+            'first_name': faker.first_name,
+            'last_name': faker.last_name,
+            'email': faker.email,
+            'phone': faker.phone_number,
+            'address': faker.address,
+            'company': faker.company,
+            'job_title': faker.job,
+            'age': partial(faker.random_int, 18, 80),
+            'date': faker.date,
+            'url': faker.url,
+            'username': faker.user_name,
+            'price': self._price,
+            'quantity': partial(faker.random_int, 1, 100),
+            'id': faker.uuid4,
+            'rating': partial(faker.random_int, 1, 5),  # Add rating
         }
 
-    def generate_mixed_data(self, field_config: Dict[str, Any], count: int = 1) -> List[Dict[str, Any]]:
+        # Vectorized numeric column generators (used by the columnar path)
+        if np is not None:
+            rng = np.random.default_rng()
+            self._np_dispatch = {
+                'price': lambda n: np.round(rng.uniform(10, 1000, n), 2),
+                'quantity': lambda n: rng.integers(1, 101, n),
+                'rating': lambda n: rng.integers(1, 6, n),
+                'age': lambda n: rng.integers(18, 81, n),
+            }
+        else:
+            self._np_dispatch = {}
+
+        # Per-instance LRU cache so bound methods are not retained class-wide
+        self._resolve_generator = lru_cache(maxsize=256)(self._resolve_generator_uncached)
+
+        # Thread pool so Faker work can overlap pending AI network I/O
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+        # Optional prompt dedupe: identical rule sets reuse the first response.
+        # Off by default since LLM outputs are intentionally varied
+        self._dedupe = dedupe
+        self._generate_cache = {}
+
+    def generate_mixed_data(self, field_config: Dict[str, Any], count: int = 1, as_objects: bool = False) -> List[Any]:
         """
         Generate mixed data
 
@@ -44,10 +126,229 @@ class SmartFieldGenerator:
                 - Format 3: {"field_name": {"ai": "description", "context": {...}}}  # AI with context
                 - Format 4: {"field_name": callable}  # Custom function
             count: Number of records to generate
+            as_objects: Return slots-based dataclass instances instead of
+                dicts (compact storage for large in-memory batches)
         """
         results = []
 
         # Separate AI fields and Faker fields
+        faker_fields, custom_functions, ai_fields, contextual_ai_fields = self._classify_fields(field_config)
+
+        # The simple-AI rule set is identical for every record, build it once
+        ai_rules = [Rule(name=field, description=desc) for field, desc in ai_fields.items()]
+        ctx_builders = self._compile_context_builders(contextual_ai_fields)
+
+        # Set on first simple-AI failure so remaining records skip the
+        # same failing round-trip and take the fallback directly
+        ai_failed_defaults = None
+
+        for i in range(count):
+            # 1+2. Generate Faker and custom function fields first (fast)
+            record = self._build_local_fields(faker_fields, custom_functions)
+
+            # 3. Batch generate simple AI fields
+            if ai_rules:
+                if ai_failed_defaults is None:
+                    try:
+                        ai_data = self._generate(ai_rules)
+                        record.update(ai_data)
+                    except Exception as e:
+                        print(f"AI generation failed: {e}")
+                        # Use default values
+                        ai_failed_defaults = {field: f"ai_generated_{field}" for field in ai_fields.keys()}
+                        record.update(ai_failed_defaults)
+                else:
+                    record.update(ai_failed_defaults)
+
+            # 4. Batch generate AI fields that need context
+            # Contexts are resolved from the already-populated record, so all
+            # contextual fields can share a single generate() call
+            if contextual_ai_fields:
+                ctx_rules = [
+                    Rule(name=field_name, description=builder(record))
+                    for field_name, builder in ctx_builders.items()
+                ]
+                try:
+                    ctx_result = self._generate(ctx_rules)
+                    for field_name in contextual_ai_fields.keys():
+                        record[field_name] = ctx_result.get(field_name, f"ai_generated_{field_name}")
+                except Exception as e:
+                    print(f"Batched contextual AI generation failed: {e}")
+                    # Fall back to individual calls per field
+                    for field_name, builder in ctx_builders.items():
+                        try:
+                            ai_rule = Rule(name=field_name, description=builder(record))
+                            ai_result = self._generate(ai_rule)
+                            record[field_name] = ai_result.get(field_name, f"ai_generated_{field_name}")
+                        except Exception as e:
+                            print(f"Contextual AI generation failed for {field_name}: {e}")
+                            record[field_name] = f"ai_generated_{field_name}"
+
+            results.append(record)
+
+        if as_objects:
+            return self._pack_records(results, list(field_config.keys()))
+        return results
+
+    @staticmethod
+    def _pack_records(records: List[Dict[str, Any]], field_names: List[str]) -> List[Any]:
+        """Pack dict records into a slots-based dataclass for compact storage"""
+        # slots support for make_dataclass landed in Python 3.10
+        kwargs = {"slots": True} if sys.version_info >= (3, 10) else {}
+        Record = make_dataclass("Record", field_names, **kwargs)
+        return [Record(**{name: rec.get(name) for name in field_names}) for rec in records]
+
+    async def astream_mixed_data(self, field_config: Dict[str, Any], count: int = 1):
+        """
+        Stream mixed data records as they complete
+
+        Async generator variant of agenerate_mixed_data: records are yielded
+        via asyncio.as_completed as soon as each one finishes, so downstream
+        consumers (printing, serialization, writes) can start work while
+        later records are still waiting on the LLM. Yield order follows
+        completion order, not request order.
+        """
+        faker_fields, custom_functions, ai_fields, contextual_ai_fields = self._classify_fields(field_config)
+
+        ai_rules = [Rule(name=field, description=desc) for field, desc in ai_fields.items()]
+        ctx_builders = self._compile_context_builders(contextual_ai_fields)
+
+        tasks = [
+            asyncio.ensure_future(
+                self._build_record(faker_fields, custom_functions, ai_fields, ai_rules, ctx_builders)
+            )
+            for _ in range(count)
+        ]
+        for task in asyncio.as_completed(tasks):
+            yield await task
+
+    def generate_mixed_data_columnar(self, field_config: Dict[str, Any], count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Generate mixed data column-major (SoA layout)
+
+        Same field configuration as generate_mixed_data, but each column is
+        generated once for all records: Faker/custom fields in tight
+        per-field loops, and each AI field as count values in a single LLM
+        call. This cuts LLM calls from O(count x ai_fields) to O(ai_fields).
+        Columns are zipped into row dicts at the end.
+        """
+        faker_fields, custom_functions, ai_fields, contextual_ai_fields = self._classify_fields(field_config)
+
+        columns = self._generate_columns(faker_fields, custom_functions, count)
+
+        # One call for all simple AI fields across all records
+        if ai_fields:
+            ai_rules = [Rule(name=field, description=desc) for field, desc in ai_fields.items()]
+            try:
+                ai_data = self.shadow_ai.generate(ai_rules, count=count)
+                rows = ai_data if isinstance(ai_data, list) else [ai_data]
+                for field in ai_fields.keys():
+                    columns[field] = self._column_from_rows(rows, field, count)
+            except Exception as e:
+                print(f"AI generation failed: {e}")
+                for field in ai_fields.keys():
+                    columns[field] = [f"ai_generated_{field}"] * count
+
+        # One call per contextual field, packing all row contexts into the prompt
+        for field_name, config in contextual_ai_fields.items():
+            related_fields = config.get('context', {}).get('related_fields', [])
+            contexts = []
+            for i in range(count):
+                context_str = ", ".join(
+                    f"{k}: {columns[k][i]}" for k in related_fields if k in columns
+                )
+                contexts.append(context_str)
+
+            description = config['ai']
+            if any(contexts):
+                numbered = "; ".join(f"record {i + 1}: ({ctx})" for i, ctx in enumerate(contexts))
+                description += f". Per-record context: {numbered}"
+
+            try:
+                result = self.shadow_ai.generate(Rule(name=field_name, description=description), count=count)
+                rows = result if isinstance(result, list) else [result]
+                columns[field_name] = self._column_from_rows(rows, field_name, count)
+            except Exception as e:
+                print(f"Contextual AI generation failed for {field_name}: {e}")
+                columns[field_name] = [f"ai_generated_{field_name}"] * count
+
+        # Zip columns back into row dicts, preserving field order
+        return [
+            {field: columns[field][i] for field in field_config.keys() if field in columns}
+            for i in range(count)
+        ]
+
+    def _generate_columns(self, faker_fields: Dict[str, Any], custom_functions: Dict[str, Any], count: int) -> Dict[str, list]:
+        """Generate Faker and custom-function columns, one tight loop per field"""
+        columns = {}
+        for field_name, faker_method in faker_fields.items():
+            np_generator = self._np_dispatch.get(faker_method)
+            if np_generator is not None:
+                # Draw the whole column in one vectorized call
+                columns[field_name] = np_generator(count).tolist()
+                continue
+            generator = self._resolve_generator(faker_method)
+            if generator:
+                columns[field_name] = [generator() for _ in range(count)]
+            else:
+                columns[field_name] = [f"unknown_{faker_method}"] * count
+        for field_name, func in custom_functions.items():
+            columns[field_name] = [func() for _ in range(count)]
+        return columns
+
+    @staticmethod
+    def _column_from_rows(rows: List[Dict[str, Any]], field: str, count: int) -> list:
+        """Extract one field column from AI row dicts, padding short responses"""
+        fallback = f"ai_generated_{field}"
+        return [
+            rows[i].get(field, fallback) if i < len(rows) else fallback
+            for i in range(count)
+        ]
+
+    def _price(self):
+        """Random price between 10 and 1000 with 2 decimals"""
+        return round(self._uniform(10, 1000), 2)
+
+    def _build_local_fields(self, faker_fields: Dict[str, Any], custom_functions: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the non-AI (Faker + custom function) fields for one record"""
+        record = {}
+        for field_name, faker_method in faker_fields.items():
+            generator = self._resolve_generator(faker_method)
+            record[field_name] = generator() if generator else f"unknown_{faker_method}"
+        for field_name, func in custom_functions.items():
+            record[field_name] = func()
+        return record
+
+    def _resolve_generator_uncached(self, faker_method):
+        """Resolve a faker method name to a bound generator"""
+        generator = self.faker_generators.get(faker_method)
+        if generator is None and isinstance(faker_method, str):
+            # Faker's __getattr__ walks its provider list, memoized above
+            generator = getattr(self.faker, faker_method, None)
+        return generator
+
+    async def agenerate_mixed_data(self, field_config: Dict[str, Any], count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Generate mixed data asynchronously
+
+        Same field configuration as generate_mixed_data, but all records are
+        generated concurrently via asyncio.gather so the LLM round-trips
+        overlap instead of running strictly sequentially.
+        """
+        faker_fields, custom_functions, ai_fields, contextual_ai_fields = self._classify_fields(field_config)
+
+        # The simple-AI rule set is identical for every record, build it once
+        ai_rules = [Rule(name=field, description=desc) for field, desc in ai_fields.items()]
+        ctx_builders = self._compile_context_builders(contextual_ai_fields)
+
+        records = await asyncio.gather(
+            *[self._build_record(faker_fields, custom_functions, ai_fields, ai_rules, ctx_builders)
+              for _ in range(count)]
+        )
+        return list(records)
+
+    def _classify_fields(self, field_config: Dict[str, Any]):
+        """Split field configuration into Faker, custom, AI and contextual-AI fields"""
         ai_fields = {}
         faker_fields = {}
         contextual_ai_fields = {}
@@ -64,57 +365,85 @@ class SmartFieldGenerator:
             else:
                 faker_fields[field_name] = config
 
-        for i in range(count):
-            record = {}
-
-            # 1. Generate Faker fields first (fast)
-            for field_name, faker_method in faker_fields.items():
-                if faker_method in self.faker_generators:
-                    record[field_name] = self.faker_generators[faker_method]()
-                elif isinstance(faker_method, str) and hasattr(self.faker, faker_method):
-                    # Handle string method names
-                    record[field_name] = getattr(self.faker, faker_method)()
-                else:
-                    record[field_name] = f"unknown_{faker_method}"
+        return faker_fields, custom_functions, ai_fields, contextual_ai_fields
+
+    def _generate(self, rules):
+        """Issue generate(), coalescing duplicate prompts when dedupe is on"""
+        if not self._dedupe:
+            return self.shadow_ai.generate(rules)
+
+        if isinstance(rules, list):
+            key = tuple((rule.name, rule.description) for rule in rules)
+        else:
+            key = (rules.name, rules.description)
+
+        if key not in self._generate_cache:
+            self._generate_cache[key] = self.shadow_ai.generate(rules)
+        return self._generate_cache[key]
+
+    async def _agenerate_limited(self, rules):
+        """Issue an agenerate call under the concurrency and rate limits"""
+        # Recreate the semaphore when the running loop changes, so one
+        # generator instance survives back-to-back asyncio.run calls
+        loop = asyncio.get_running_loop()
+        if self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._sem_loop = loop
+        async with self._sem:
+            if self._limiter:
+                await self._limiter.acquire()
+            return await self.shadow_ai.agenerate(rules)
+
+    async def _build_record(self, faker_fields, custom_functions, ai_fields, ai_rules, ctx_builders) -> Dict[str, Any]:
+        """Build a single record asynchronously (same 4 phases as generate_mixed_data)"""
+        # 1+2. Run Faker and custom function fields in the thread pool so
+        # their CPU time overlaps other records' pending AI network I/O
+        loop = asyncio.get_running_loop()
+        record = await loop.run_in_executor(
+            self._pool, self._build_local_fields, faker_fields, custom_functions
+        )
+
+        # 3. Batch generate simple AI fields
+        if ai_rules:
+            try:
+                ai_data = await self._agenerate_limited(ai_rules)
+                record.update(ai_data)
+            except Exception as e:
+                print(f"AI generation failed: {e}")
+                for field in ai_fields.keys():
+                    record[field] = f"ai_generated_{field}"
+
+        # 4. Batch generate AI fields that need context
+        if ctx_builders:
+            ctx_rules = [
+                Rule(name=field_name, description=builder(record))
+                for field_name, builder in ctx_builders.items()
+            ]
+            try:
+                ctx_result = await self._agenerate_limited(ctx_rules)
+                for field_name in ctx_builders.keys():
+                    record[field_name] = ctx_result.get(field_name, f"ai_generated_{field_name}")
+            except Exception as e:
+                print(f"Batched contextual AI generation failed: {e}")
+                for field_name in ctx_builders.keys():
+                    record[field_name] = f"ai_generated_{field_name}"
 
-            # 2. Generate custom function fields
-            for field_name, func in custom_functions.items():
-                record[field_name] = func()
+        return record
 
-            # 3. Batch generate simple AI fields
-            if ai_fields:
-                ai_rules = [Rule(name=field, description=desc) for field, desc in ai_fields.items()]
-                try:
-                    ai_data = self.shadow_ai.generate(ai_rules)
-                    record.update(ai_data)
-                except Exception as e:
-                    print(f"AI generation failed: {e}")
-                    # Use default values
-                    for field in ai_fields.keys():
-                        record[field] = f"ai_generated_{field}"
+    @staticmethod
+    def _compile_context_builders(contextual_ai_fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompile one description builder closure per contextual field"""
+        builders = {}
+        for field_name, config in contextual_ai_fields.items():
+            base = config['ai']
+            keys = tuple(config.get('context', {}).get('related_fields', []))
 
-            # 4. Generate AI fields that need context
-            for field_name, config in contextual_ai_fields.items():
-                try:
-                    context = config.get('context', {})
-                    # Use related fields from current record as context
-                    related_fields = context.get('related_fields', [])
-                    context_str = ", ".join([f"{k}: {record.get(k, 'N/A')}" for k in related_fields if k in record])
-
-                    description = config['ai']
-                    if context_str:
-                        description += f". Context: {context_str}"
-
-                    ai_rule = Rule(name=field_name, description=description)
-                    ai_result = self.shadow_ai.generate(ai_rule)
-                    record[field_name] = ai_result.get(field_name, f"ai_generated_{field_name}")
-                except Exception as e:
-                    print(f"Contextual AI generation failed for {field_name}: {e}")
-                    record[field_name] = f"ai_generated_{field_name}"
+            def builder(record, base=base, keys=keys):
+                context_str = ", ".join(f"{k}: {record[k]}" for k in keys if k in record)
+                return f"{base}. Context: {context_str}" if context_str else base
 
-            results.append(record)
-
-        return results
+            builders[field_name] = builder
+        return builders
 
 
 def generate_ecommerce_data():
@@ -150,9 +479,9 @@ def generate_ecommerce_data():
     print("🚀 Generating e-commerce mixed data...")
     data = generator.generate_mixed_data(ecommerce_config, count=2)
 
-    for i, record in enumerate(data, 1):
-        print(f"\n📦 Order {i}:")
-        print(json.dumps(record, indent=2, ensure_ascii=False))
+    # Accumulate output and write once instead of flushing per record
+    parts = [f"\n📦 Order {i}:\n{_dumps(record)}" for i, record in enumerate(data, 1)]
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return data
 
@@ -189,9 +518,9 @@ def generate_user_feedback():
     print("\n💬 Generating user feedback data...")
     data = generator.generate_mixed_data(feedback_config, count=2)
 
-    for i, record in enumerate(data, 1):
-        print(f"\n📝 Feedback {i}:")
-        print(json.dumps(record, indent=2, ensure_ascii=False))
+    # Accumulate output and write once instead of flushing per record
+    parts = [f"\n📝 Feedback {i}:\n{_dumps(record)}" for i, record in enumerate(data, 1)]
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return data
 
@@ -212,11 +541,13 @@ def custom_example():
 
     print("\n🔧 Custom function example...")
     data = generator.generate_mixed_data(custom_config, count=1)
-    print(json.dumps(data[0], indent=2, ensure_ascii=False))
+    print(_dumps(data[0]))
 
 
 # Usage example
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
     load_dotenv()
     try:
         generate_ecommerce_data()
@@ -4,16 +4,15 @@ ShadowAI File Loading Examples
 Demonstrates how to load rules from JSON and YAML files.
 """
 
+import io
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Add project root directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
-
+import _bootstrap  # noqa: F401  (sys.path and .env setup, shared by all examples)
 from shadow_ai import ShadowAI
 from shadow_ai.rules.packages import person_package
 from shadow_ai.utils.file_utils import (
@@ -21,9 +20,72 @@ from shadow_ai.utils.file_utils import (
     load_rules_from_json,
     load_rules_from_yaml,
     save_rules_to_json,
+    save_rules_to_json_many,
     save_rules_to_yaml,
 )
 
+# All demos write their artifacts into the same directory; create it once
+OUTPUT_DIR = "demo_output"
+
+# Rule lines built once instead of re-multiplied on every print
+_EQ30 = "=" * 30
+_EQ35 = "=" * 35
+_EQ50 = "=" * 50
+
+
+def banner(title, line=_EQ30):
+    """Print a section title with its underline"""
+    print(title)
+    print(line)
+
+
+# Per-thread print buffering so parallel demos don't interleave their output
+_local = threading.local()
+
+
+class _StdoutRouter:
+    """Route writes to the current thread's buffer, or the real stdout"""
+
+    def __init__(self, real):
+        self._real = real
+
+    def write(self, s):
+        getattr(_local, "buffer", self._real).write(s)
+
+    def flush(self):
+        self._real.flush()
+
+
+@contextmanager
+def _buffered_stdout():
+    original = sys.stdout
+    sys.stdout = _StdoutRouter(original)
+    try:
+        yield
+    finally:
+        sys.stdout = original
+
+
+def _run_buffered(demo, *args):
+    """Run a demo with its print output captured in a thread-local buffer"""
+    _local.buffer = io.StringIO()
+    try:
+        demo(*args)
+        return _local.buffer.getvalue()
+    except BaseException as e:
+        # Keep what the demo printed before failing so the caller can
+        # flush it ahead of the propagating exception
+        e.partial_output = _local.buffer.getvalue()
+        raise
+    finally:
+        del _local.buffer
+
+
+@lru_cache(maxsize=None)
+def get_shadow_ai():
+    """Return a shared ShadowAI instance so repeated demo runs reuse the warm client"""
+    return ShadowAI()
+
 
 def create_sample_rule_files():
     """Create sample rule files"""
@@ -64,28 +126,25 @@ def create_sample_rule_files():
     return sample_rules
 
 
-def demonstrate_json_operations():
+def demonstrate_json_operations(sample_rules, person_data):
     """Demonstrate JSON file operations"""
 
-    print("📄 JSON File Operations")
-    print("=" * 30)
-
-    # Create demo_output directory
-    output_dir = "demo_output"
-    os.makedirs(output_dir, exist_ok=True)
+    banner("📄 JSON File Operations")
 
     # Save rules to JSON
     print("\n💾 Saving rules to JSON...")
-    json_path = os.path.join(output_dir, "person_package.json")
-    save_rules_to_json(person_package, json_path)
+    json_path = os.path.join(OUTPUT_DIR, "person_package.json")
+    save_rules_to_json(person_data, json_path)
     print(f"✅ Saved person_package to: {json_path}")
 
-    # Save custom sample rules
-    sample_rules = create_sample_rule_files()
-    for i, rule in enumerate(sample_rules):
-        rule_path = os.path.join(output_dir, f"sample_rule_{i+1}.json")
-        save_rules_to_json(rule, rule_path)
-        print(f"✅ Saved sample rule {i+1} to: {rule_path}")
+    # Save custom sample rules (independent writes, so overlap the file I/O)
+    rule_paths = [
+        os.path.join(OUTPUT_DIR, f"sample_rule_{i+1}.json") for i in range(len(sample_rules))
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save_rules_to_json, sample_rules, rule_paths))
+    for index, rule_path in enumerate(rule_paths, start=1):
+        print(f"✅ Saved sample rule {index} to: {rule_path}")
 
     # Load rules from JSON
     print("\n📖 Loading rules from JSON...")
@@ -97,28 +156,25 @@ def demonstrate_json_operations():
     return loaded_person, sample_rules
 
 
-def demonstrate_yaml_operations():
+def demonstrate_yaml_operations(sample_rules, person_data):
     """Demonstrate YAML file operations"""
 
-    print("\n📄 YAML File Operations")
-    print("=" * 30)
-
-    # Create demo_output directory
-    output_dir = "demo_output"
-    os.makedirs(output_dir, exist_ok=True)
+    banner("\n📄 YAML File Operations")
 
     # Save rules to YAML
     print("\n💾 Saving rules to YAML...")
-    yaml_path = os.path.join(output_dir, "person_package.yaml")
-    save_rules_to_yaml(person_package, yaml_path)
+    yaml_path = os.path.join(OUTPUT_DIR, "person_package.yaml")
+    save_rules_to_yaml(person_data, yaml_path)
     print(f"✅ Saved person_package to: {yaml_path}")
 
-    # Save custom sample rules
-    sample_rules = create_sample_rule_files()
-    for i, rule in enumerate(sample_rules):
-        rule_path = os.path.join(output_dir, f"sample_rule_{i+1}.yaml")
-        save_rules_to_yaml(rule, rule_path)
-        print(f"✅ Saved sample rule {i+1} to: {rule_path}")
+    # Save custom sample rules (independent writes, so overlap the file I/O)
+    rule_paths = [
+        os.path.join(OUTPUT_DIR, f"sample_rule_{i+1}.yaml") for i in range(len(sample_rules))
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save_rules_to_yaml, sample_rules, rule_paths))
+    for index, rule_path in enumerate(rule_paths, start=1):
+        print(f"✅ Saved sample rule {index} to: {rule_path}")
 
     # Load rules from YAML
     print("\n📖 Loading rules from YAML...")
@@ -133,35 +189,34 @@ def demonstrate_yaml_operations():
 def demonstrate_data_generation_from_files():
     """Demonstrate data generation from loaded files"""
 
-    print("\n🎮 Data Generation from Files")
-    print("=" * 35)
+    banner("\n🎮 Data Generation from Files", _EQ35)
 
-    # Initialize ShadowAI
-    shadow_ai = ShadowAI()
+    # Reuse the shared ShadowAI instance
+    shadow_ai = get_shadow_ai()
 
-    # Load rules from files
-    output_dir = "demo_output"
+    # One directory read replaces a stat call per file below
+    present = {entry.name for entry in os.scandir(OUTPUT_DIR)} if os.path.isdir(OUTPUT_DIR) else set()
 
     try:
         # Load and use JSON rules
-        json_path = os.path.join(output_dir, "person_package.json")
-        if os.path.exists(json_path):
+        json_path = os.path.join(OUTPUT_DIR, "person_package.json")
+        if "person_package.json" in present:
             json_rules = load_rules_from_json(json_path)
             print(f"\n🔧 Using JSON loaded rules:")
             result = shadow_ai.generate(json_rules, format_output=False)
             print(f"Generated person: {result}")
 
         # Load and use YAML rules
-        yaml_path = os.path.join(output_dir, "person_package.yaml")
-        if os.path.exists(yaml_path):
+        yaml_path = os.path.join(OUTPUT_DIR, "person_package.yaml")
+        if "person_package.yaml" in present:
             yaml_rules = load_rules_from_yaml(yaml_path)
             print(f"\n🔧 Using YAML loaded rules:")
             result = shadow_ai.generate(yaml_rules, format_output=False)
             print(f"Generated person: {result}")
 
         # Load and use sample rules
-        sample_rule_path = os.path.join(output_dir, "sample_rule_3.json")
-        if os.path.exists(sample_rule_path):
+        sample_rule_path = os.path.join(OUTPUT_DIR, "sample_rule_3.json")
+        if "sample_rule_3.json" in present:
             sample_rules = load_rules_from_json(sample_rule_path)
             print(f"\n🔧 Using sample rule package:")
             result = shadow_ai.generate(sample_rules, format_output=False)
@@ -175,8 +230,7 @@ def demonstrate_data_generation_from_files():
 def demonstrate_file_templates():
     """Demonstrate rule template creation"""
 
-    print("\n📋 Rule Template Creation")
-    print("=" * 30)
+    banner("\n📋 Rule Template Creation")
 
     # Create templates for different rule types
     record_template = create_rule_template("record")
@@ -189,7 +243,6 @@ def demonstrate_file_templates():
     print(f"Package template: {package_template}")
 
     # Save templates to files
-    output_dir = "demo_output"
     templates = [
         ("record_template.json", record_template),
         ("combination_template.json", combination_template),
@@ -197,27 +250,53 @@ def demonstrate_file_templates():
     ]
 
     print("\n💾 Saving templates to files:")
-    for filename, template in templates:
-        filepath = os.path.join(output_dir, filename)
-        save_rules_to_json(template, filepath)
+    save_rules_to_json_many(
+        [(os.path.join(OUTPUT_DIR, filename), template) for filename, template in templates]
+    )
+    for filename, _ in templates:
         print(f"✅ Saved {filename}")
 
 
 def main():
     """Main function demonstrating file operations"""
 
-    print("📁 ShadowAI File Loading Examples")
-    print("=" * 50)
+    banner("📁 ShadowAI File Loading Examples", _EQ50)
     print("Shows how to save and load rules from JSON and YAML files")
 
-    # Demonstrate various file operations
-    demonstrate_json_operations()
-    demonstrate_yaml_operations()
-    demonstrate_file_templates()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Build the sample rules once and share them across the demos
+    sample_rules = create_sample_rule_files()
+
+    # Walk person_package into a plain dict once; both savers accept dicts
+    person_data = person_package.to_dict()
+
+    # The first three demos write to independent paths, so run them in
+    # parallel and flush each one's buffered output as it finishes
+    with _buffered_stdout():
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_run_buffered, demonstrate_json_operations, sample_rules, person_data),
+                executor.submit(_run_buffered, demonstrate_yaml_operations, sample_rules, person_data),
+                executor.submit(_run_buffered, demonstrate_file_templates),
+            ]
+            # A failing demo still gets its partial output flushed, and the
+            # sibling demos are drained before the first error propagates
+            first_error = None
+            for future in as_completed(futures):
+                try:
+                    sys.stdout.write(future.result())
+                except Exception as e:
+                    sys.stdout.write(getattr(e, "partial_output", ""))
+                    if first_error is None:
+                        first_error = e
+            if first_error is not None:
+                raise first_error
+
+    # This one reads the artifacts produced above, so it runs after the join
     demonstrate_data_generation_from_files()
 
-    print("\n🎯 Summary:")
-    print("=" * 30)
+    banner("\n🎯 Summary:")
     print("✅ Supported file formats:")
     print("   • JSON - save_rules_to_json() / load_rules_from_json()")
     print("   • YAML - save_rules_to_yaml() / load_rules_from_yaml()")
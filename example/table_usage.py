@@ -6,16 +6,31 @@ This script demonstrates how to use ShadowAI's table generation capabilities.
 """
 
 import os
-import sys
 
-from dotenv import load_dotenv
+try:
+    import orjson
 
-# Add the lib directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+    def _dumps_pretty(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
-from shadow_ai import ShadowAI, TableRule, TableOutputFormat, Rule, TableTemplates
+except ImportError:  # orjson is optional, stdlib json is used instead
+    import json
+
+    def _dumps_pretty(data):
+        return json.dumps(data, indent=2)
+
+import _bootstrap  # noqa: F401  (sys.path and .env setup, shared by all examples)
+from shadow_ai import ShadowAI, TableRule, TableOutputFormat, Rule, TableTemplates, TableFormatter
 
-load_dotenv()
+# Static demo rows, built once at import instead of on every main() call
+_SAMPLE_DATA = [
+    {"id": 1, "name": "John Doe", "age": 30, "city": "New York"},
+    {"id": 2, "name": "Jane Smith", "age": 25, "city": "Los Angeles"},
+    {"id": 3, "name": "Bob Johnson", "age": 35, "city": "Chicago"},
+]
+
+# The markdown rendering is pure, so precompute it as well
+_SAMPLE_MD = TableFormatter.to_markdown(_SAMPLE_DATA, "Sample Users")
 
 def main():
     """Main demonstration function"""
@@ -144,23 +159,15 @@ def main():
     print("-" * 30)
     
     # Show format examples (without API calls)
-    sample_data = [
-        {"id": 1, "name": "John Doe", "age": 30, "city": "New York"},
-        {"id": 2, "name": "Jane Smith", "age": 25, "city": "Los Angeles"},
-        {"id": 3, "name": "Bob Johnson", "age": 35, "city": "Chicago"}
-    ]
-    
-    from shadow_ai import TableFormatter
-    
     print("Sample data in different formats:")
     print("\n📝 Markdown:")
-    print(TableFormatter.to_markdown(sample_data, "Sample Users"))
-    
+    print(_SAMPLE_MD)
+
     print("\n📊 CSV:")
-    print(TableFormatter.to_csv(sample_data))
-    
+    print(TableFormatter.to_csv(_SAMPLE_DATA))
+
     print("\n🌐 HTML:")
-    html_output = TableFormatter.to_html(sample_data, "Sample Users")
+    html_output = TableFormatter.to_html(_SAMPLE_DATA, "Sample Users")
     # Show first few lines of HTML
     html_lines = html_output.split('\n')
     for line in html_lines[:10]:
@@ -204,8 +211,7 @@ def main():
     }
     
     print("Configuration dictionary for survey table:")
-    import json
-    print(json.dumps(table_config, indent=2))
+    print(_dumps_pretty(table_config))
     
     try:
         # Use the configuration
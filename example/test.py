@@ -3,12 +3,10 @@
 Simple test script for ShadowAI
 """
 
-# Add project root directory to path
 import os
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
-
+import _bootstrap  # noqa: F401  (sys.path and .env setup, shared by all examples)
 from shadow_ai import ShadowAI
 
 
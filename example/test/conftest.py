@@ -4,11 +4,10 @@ pytest Configuration File
 Defines test fixtures and global configuration.
 """
 
-import json
 import os
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -18,54 +17,153 @@ lib_path = project_root / "lib"
 sys.path.insert(0, str(lib_path))
 
 # Import ShadowAI components
-from shadow_ai import Rule, RuleCombination, RulePackage, ShadowAI
+from shadow_ai import Rule, RuleCombination, RulePackage, RuleType, ShadowAI
 from shadow_ai.utils.file_utils import load_rules_from_json, save_rules_to_json
 
-# Also need to import agno components for mocking
-try:
-    from agno.agent import Agent
-    from agno.models.openai import OpenAIChat
-except ImportError:
-    # If agno is not installed, create dummy classes
-    Agent = None
-    OpenAIChat = None
+# Note: agno is not imported here directly, but the shadow_ai import above
+# pulls it in eagerly via core.shadow_ai, so collection still pays that
+# import chain once per worker.
+
+
+@pytest.fixture(scope="session")
+def shadow_ai_shared():
+    """Fixture for the session-wide ShadowAI instance
+
+    Construction builds the underlying model and agent, so it is paid once
+    per pytest invocation; tests that talk to the agent swap in their own
+    mock via the shadow_ai fixture below.
+    """
+    return ShadowAI()
 
 
 @pytest.fixture
-def shadow_ai_instance():
+def shadow_ai(shadow_ai_shared, mock_agent, monkeypatch):
+    """Fixture for the shared ShadowAI with this test's mock agent assigned
+
+    monkeypatch restores the original agent afterwards so the
+    session-scoped instance never leaks one test's mock into the next.
+    """
+    monkeypatch.setattr(shadow_ai_shared, "agent", mock_agent)
+    return shadow_ai_shared
+
+
+@pytest.fixture
+def shadow_ai_instance(shadow_ai_shared):
     """Fixture for creating ShadowAI instance"""
-    return ShadowAI()
+    return shadow_ai_shared
+
+
+# Plain named rules shared across the RuleCombination/RulePackage suites.
+# These fixtures are only ever read (identity and name checks), so a single
+# instance per pytest invocation is safe; tests that mutate must use the
+# function-scoped base_* fixtures below instead.
+@pytest.fixture(scope="session")
+def rules_pool():
+    """Fixture for the shared pool of read-only named rules"""
+    # The names are known-valid literals, so Rule.fast can skip validation;
+    # TestRuleValidation keeps exercising the validating constructor.
+    return {
+        name: Rule.fast(name)
+        for name in ("name", "email", "first_name", "last_name", "phone", "age")
+    }
+
+
+@pytest.fixture(scope="session")
+def name_rule(rules_pool):
+    """Fixture for a shared read-only Rule named "name" """
+    return rules_pool["name"]
+
+
+@pytest.fixture(scope="session")
+def email_rule(rules_pool):
+    """Fixture for a shared read-only Rule named "email" """
+    return rules_pool["email"]
+
+
+@pytest.fixture(scope="session")
+def first_name_rule(rules_pool):
+    """Fixture for a shared read-only Rule named "first_name" """
+    return rules_pool["first_name"]
+
+
+@pytest.fixture(scope="session")
+def last_name_rule(rules_pool):
+    """Fixture for a shared read-only Rule named "last_name" """
+    return rules_pool["last_name"]
+
+
+# Invalid constructor argument sets shared by the RuleCombination and
+# RulePackage validation suites — both classes reject the same shapes, so
+# the table lives here instead of being duplicated per file.
+INVALID_CONTAINER_KWARGS = [
+    {"name": "", "rules": ["name"]},  # empty name
+    {"name": None, "rules": ["name"]},  # None name
+    {"name": "test", "rules": "invalid"},  # rules should be a list
+]
+
+
+@pytest.fixture(scope="session")
+def contact_combo():
+    """Fixture for the shared read-only email/phone contact combination"""
+    return RuleCombination(name="contact", rules=["email", "phone"])
+
+
+# Canonical chain-test bases, validated once at import. Chain methods like
+# add_rule mutate in place, so each test receives a deep model_copy — which
+# skips re-validation — instead of re-running the full constructor.
+_BASE_COMBO = RuleCombination(name="test", rules=["name"])
+_BASE_PACKAGE = RulePackage(name="test", rules=["name"])
+
+
+@pytest.fixture
+def base_combo():
+    """Fixture for a fresh single-rule RuleCombination to mutate in chain tests"""
+    return _BASE_COMBO.model_copy(deep=True)
 
 
+@pytest.fixture
+def base_package():
+    """Fixture for a fresh single-rule RulePackage to mutate in chain tests"""
+    return _BASE_PACKAGE.model_copy(deep=True)
+
+
+# The sample_* fixtures only need a valid object, not to exercise the
+# validators, so they use model_construct with every field spelled out;
+# the validation test classes keep using the real constructors.
 @pytest.fixture
 def sample_rule():
     """Fixture for creating sample Rule"""
-    return Rule(
+    return Rule.model_construct(
         name="test_email",
         description="Generate a test email address",
+        rule_type=RuleType.RECORD,
+        metadata=None,
         examples=["test@example.com", "user@domain.com"],
+        constraints=None,
     )
 
 
 @pytest.fixture
 def sample_combination():
     """Fixture for creating sample RuleCombination"""
-    return RuleCombination(
+    return RuleCombination.model_construct(
         name="test_user",
         description="Test user profile combination",
         rules=["name", "email", "age"],
+        combination_logic="combine",
     )
 
 
 @pytest.fixture
 def sample_package():
     """Fixture for creating sample RulePackage"""
-    return RulePackage(
+    return RulePackage.model_construct(
         name="test_person",
         description="Test person information package",
         rules=["name", "email", "age", "phone"],
         category="test",
         version="1.0.0",
+        metadata=None,
     )
 
 
@@ -81,64 +179,43 @@ def temp_yaml_file(tmp_path):
     return tmp_path / "test_rules.yaml"
 
 
-@pytest.fixture
-def mock_agno_agent():
-    """Mock Agno agent fixture to avoid real API calls"""
-    # Mock both OpenAIChat and Agent to completely bypass actual agno calls
-    with patch("shadow_ai.core.shadow_ai.OpenAIChat") as mock_openai, patch(
-        "shadow_ai.core.shadow_ai.Agent"
-    ) as mock_agent:
-
-        # Create mock OpenAIChat instance
-        mock_openai_instance = Mock()
-        mock_openai.return_value = mock_openai_instance
-
-        # Create mock Agent instance
-        mock_agent_instance = Mock()
-
-        def mock_run(prompt, stream=False):
-            """Mock run method that returns JSON format content"""
-            # Check if prompt contains count information
-            import re
-
-            # Match "Generate an array of {count} JSON objects" format
-            count_match = re.search(r"Generate an array of (\d+) JSON objects", prompt)
-
-            if count_match:
-                count = int(count_match.group(1))
-                # Return array format
-                data = []
-                for i in range(count):
-                    data.append(
-                        {
-                            "email": f"test{i+1}@example.com",
-                            "name": f"John Doe {i+1}",
-                            "age": 30 + i,
-                        }
-                    )
-            else:
-                # Return single object
-                data = {"email": "test@example.com", "name": "John Doe", "age": 30}
-
-            # Create mock response object
-            mock_response = Mock()
-            mock_response.content = json.dumps(data)
-            return mock_response
-
-        # Set Agent.run method to use our mock function
-        mock_agent_instance.run.side_effect = mock_run
-
-        # Set Agent constructor to return our mock instance
-        mock_agent.return_value = mock_agent_instance
-
-        yield mock_agent_instance
+# One mock agent for the whole session; reset_mock between tests is much
+# cheaper than building a fresh Mock graph (run, return_value, content...)
+# for every test that touches the agent.
+_AGENT_MOCK = Mock()
+_AGENT_CLASS_MOCK = Mock(return_value=_AGENT_MOCK)
 
 
 @pytest.fixture
+def mock_agent(monkeypatch):
+    """Swap the agno Agent for the shared mock via direct attribute assignment
+
+    monkeypatch.setattr is a plain setattr/restore pair, far cheaper than
+    entering and exiting a unittest.mock patcher in every test; tests
+    configure mock_agent.run themselves.
+    """
+    import shadow_ai.core.shadow_ai as core_module
+
+    _AGENT_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(core_module, "Agent", _AGENT_CLASS_MOCK)
+    return _AGENT_MOCK
+
+
+@pytest.fixture(scope="session", autouse=True)
 def mock_api_key():
-    """Mock API key fixture"""
-    with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-        yield "test-key"
+    """Mock API key fixture
+
+    Session-scoped and autouse: the key is set once per pytest invocation
+    rather than patched and unpatched around every test, and restored when
+    the session ends.
+    """
+    previous = os.environ.get("OPENAI_API_KEY")
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    yield "test-key"
+    if previous is None:
+        os.environ.pop("OPENAI_API_KEY", None)
+    else:
+        os.environ["OPENAI_API_KEY"] = previous
 
 
 # pytest configuration
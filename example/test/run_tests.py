@@ -6,19 +6,40 @@ Provides convenient test running interface with support for multiple test modes.
 """
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
 
-def run_command(cmd, description):
+
+def run_command(cmd, description, in_process=True):
     """Run command and display results"""
     print(f"\n🔧 {description}")
     print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
 
+    if cmd[0] == "pytest" and in_process:
+        # Run pytest in-process, skipping a full interpreter startup per mode
+        old_cwd = os.getcwd()
+        os.chdir(Path(__file__).parent)
+        try:
+            exit_code = pytest.main(cmd[1:])
+        finally:
+            os.chdir(old_cwd)
+
+        if exit_code == 0:
+            print(f"✅ {description} - Success")
+            return True
+        print(f"❌ {description} - Failed (exit code: {exit_code})")
+        return False
+
+    if cmd[0] == "pytest":
+        cmd = [sys.executable, "-m", "pytest"] + cmd[1:]
+
     try:
-        result = subprocess.run(cmd, check=True, cwd=Path(__file__).parent)
+        subprocess.run(cmd, check=True, cwd=Path(__file__).parent)
         print(f"✅ {description} - Success")
         return True
     except subprocess.CalledProcessError as e:
@@ -90,11 +111,13 @@ def main():
             print("   - HTML report: htmlcov/index.html")
             print("   - Terminal report displayed above")
 
-    # If coverage option is specified, run additional coverage
+    # If coverage option is specified, run additional coverage. pytest
+    # warns against calling pytest.main twice in one process (module and
+    # import caching), so this second invocation gets a fresh interpreter.
     if args.coverage and args.mode != "coverage":
         print("\n" + "=" * 50)
         cmd = base_cmd + ["--cov=shadowai", "--cov-report=term-missing", "."]
-        run_command(cmd, "Generate coverage report")
+        run_command(cmd, "Generate coverage report", in_process=False)
 
     # Display results
     print("\n" + "=" * 50)
@@ -5,10 +5,23 @@ Tests all functionality of the RuleCombination class, including creation, valida
 """
 
 import pytest
+from .conftest import INVALID_CONTAINER_KWARGS
 from pydantic import ValidationError
 from shadow_ai import Rule, RuleCombination
 
 
+@pytest.fixture(scope="module")
+def user_profile_combo():
+    """Shared read-only combination for the prompt assertions below"""
+    return RuleCombination(name="user_profile", rules=["name", "email"])
+
+
+@pytest.fixture(scope="module")
+def user_profile_combo_prompt(user_profile_combo):
+    """Prompt text of user_profile_combo, generated once for all needle checks"""
+    return user_profile_combo.to_prompt()
+
+
 class TestRuleCombinationCreation:
     """Test RuleCombination creation functionality"""
 
@@ -21,27 +34,22 @@ class TestRuleCombinationCreation:
         assert combo.rules == ["name", "email"]
         assert combo.combination_logic == "combine"
 
-    def test_create_combination_with_rule_objects(self):
+    def test_create_combination_with_rule_objects(self, name_rule, email_rule):
         """Test creating RuleCombination with Rule objects"""
-        rule1 = Rule(name="name")
-        rule2 = Rule(name="email")
-
-        combo = RuleCombination(name="user_info", rules=[rule1, rule2])
+        combo = RuleCombination(name="user_info", rules=[name_rule, email_rule])
 
         assert combo.name == "user_info"
         assert len(combo.rules) == 2
-        assert combo.rules[0] == rule1
-        assert combo.rules[1] == rule2
+        assert combo.rules[0] == name_rule
+        assert combo.rules[1] == email_rule
 
-    def test_create_combination_mixed_rules(self):
+    def test_create_combination_mixed_rules(self, name_rule):
         """Test creating with mixed strings and Rule objects"""
-        rule1 = Rule(name="name")
-
-        combo = RuleCombination(name="mixed_profile", rules=[rule1, "email", "age"])
+        combo = RuleCombination(name="mixed_profile", rules=[name_rule, "email", "age"])
 
         assert combo.name == "mixed_profile"
         assert len(combo.rules) == 3
-        assert combo.rules[0] == rule1
+        assert combo.rules[0] == name_rule
         assert combo.rules[1] == "email"
         assert combo.rules[2] == "age"
 
@@ -63,55 +71,40 @@ class TestRuleCombinationCreation:
 class TestRuleCombinationAutoDescription:
     """Test RuleCombination auto-description generation"""
 
-    def test_auto_description_simple(self):
-        """Test auto-description generation for simple rule lists"""
-        combo = RuleCombination(name="contact_info", rules=["email", "phone"])
-
-        assert combo.description == "Combine email, phone to create contact info"
-
-    def test_auto_description_many_rules(self):
-        """Test auto-description generation for multiple rules (only shows first 3)"""
-        combo = RuleCombination(
-            name="full_profile", rules=["name", "email", "phone", "address", "age"]
-        )
-
-        # Only shows first 3 rules
-        assert "name, email, phone" in combo.description
-        assert combo.description == "Combine name, email, phone to create full profile"
-
-    def test_auto_description_with_rule_objects(self):
+    @pytest.mark.parametrize(
+        "name,rules,expected",
+        [
+            # Simple rule list
+            ("contact_info", ["email", "phone"], "Combine email, phone to create contact info"),
+            # Many rules: only the first 3 are shown
+            (
+                "full_profile",
+                ["name", "email", "phone", "address", "age"],
+                "Combine name, email, phone to create full profile",
+            ),
+            # Empty rule list
+            ("empty_combo", [], "Combination for empty combo"),
+        ],
+    )
+    def test_auto_description(self, name, rules, expected):
+        """Test auto-description generation across rule-list shapes"""
+        assert RuleCombination(name=name, rules=rules).description == expected
+
+    def test_auto_description_with_rule_objects(self, first_name_rule, last_name_rule):
         """Test auto-description generation with Rule objects"""
-        rule1 = Rule(name="first_name")
-        rule2 = Rule(name="last_name")
-
-        combo = RuleCombination(name="full_name", rules=[rule1, rule2])
+        combo = RuleCombination(name="full_name", rules=[first_name_rule, last_name_rule])
 
         assert combo.description == "Combine first_name, last_name to create full name"
 
-    def test_auto_description_empty_rules(self):
-        """Test auto-description generation for empty rule list"""
-        combo = RuleCombination(name="empty_combo", rules=[])
-
-        assert combo.description == "Combination for empty combo"
-
 
 class TestRuleCombinationValidation:
     """Test RuleCombination validation functionality"""
 
-    def test_empty_name_raises_error(self):
-        """Test empty name raises error"""
-        with pytest.raises(ValidationError):
-            RuleCombination(name="", rules=["name"])
-
-    def test_none_name_raises_error(self):
-        """Test None name raises error"""
+    @pytest.mark.parametrize("kwargs", INVALID_CONTAINER_KWARGS)
+    def test_invalid_construction_raises_error(self, kwargs):
+        """Test invalid constructor arguments raise an error"""
         with pytest.raises((ValidationError, TypeError)):
-            RuleCombination(name=None, rules=["name"])
-
-    def test_invalid_rules_type_raises_error(self):
-        """Test invalid rules type raises error"""
-        with pytest.raises(ValidationError):
-            RuleCombination(name="test", rules="invalid")  # should be a list
+            RuleCombination(**kwargs)
 
 
 class TestRuleCombinationSimpleCreation:
@@ -139,15 +132,15 @@ class TestRuleCombinationSimpleCreation:
 class TestRuleCombinationChainMethods:
     """Test RuleCombination chain methods"""
 
-    def test_with_logic_method(self):
+    def test_with_logic_method(self, base_combo):
         """Test with_logic method"""
-        combo = RuleCombination(name="test", rules=["name", "email"]).with_logic("join")
+        combo = base_combo.with_logic("join")
 
         assert combo.combination_logic == "join"
 
-    def test_add_rule_method(self):
+    def test_add_rule_method(self, base_combo):
         """Test add_rule method"""
-        combo = RuleCombination(name="test", rules=["name"]).add_rule("email").add_rule("phone")
+        combo = base_combo.add_rule("email").add_rule("phone")
 
         assert len(combo.rules) == 3
         assert "name" in combo.rules
@@ -158,15 +151,10 @@ class TestRuleCombinationChainMethods:
 class TestRuleCombinationPromptGeneration:
     """Test RuleCombination prompt generation"""
 
-    def test_to_prompt_basic(self):
+    @pytest.mark.parametrize("needle", ["user_profile", "name", "email", "combine"])
+    def test_to_prompt_basic(self, user_profile_combo_prompt, needle):
         """Test basic prompt generation"""
-        combo = RuleCombination(name="user_profile", rules=["name", "email"])
-        prompt = combo.to_prompt()
-
-        assert "user_profile" in prompt
-        assert "name" in prompt
-        assert "email" in prompt
-        assert "combine" in prompt.lower()
+        assert needle in user_profile_combo_prompt.lower()
 
     def test_to_prompt_with_custom_logic(self):
         """Test prompt generation with custom logic"""
@@ -190,40 +178,52 @@ class TestRuleCombinationPromptGeneration:
 class TestRuleCombinationDictSerialization:
     """Test RuleCombination dictionary serialization"""
 
-    def test_to_dict_basic(self):
+    def test_to_dict_basic(self, user_profile_combo):
         """Test basic dictionary conversion"""
-        combo = RuleCombination(name="user_profile", rules=["name", "email"])
-        combo_dict = combo.to_dict()
+        combo_dict = user_profile_combo.to_dict()
 
         assert combo_dict["name"] == "user_profile"
         assert combo_dict["rules"] == ["name", "email"]
         assert combo_dict["combination_logic"] == "combine"
 
-    def test_to_dict_with_rule_objects(self):
+    def test_to_dict_with_rule_objects(self, name_rule):
         """Test dictionary conversion with Rule objects"""
-        rule1 = Rule(name="name")
-        combo = RuleCombination(name="profile", rules=[rule1, "email"])
+        combo = RuleCombination(name="profile", rules=[name_rule, "email"])
         combo_dict = combo.to_dict()
 
-        # Rule objects should be converted to string names or dictionaries
-        assert "name" in str(combo_dict["rules"])
-        assert "email" in str(combo_dict["rules"])
+        # Rule objects should be converted to string names or dictionaries;
+        # inspect the entries directly rather than stringifying the whole list
+        names = [r if isinstance(r, str) else r.get("name") for r in combo_dict["rules"]]
+        assert "name" in names
+        assert "email" in names
 
 
 class TestRuleCombinationMethods:
     """Test other RuleCombination methods"""
 
-    def test_get_rule_names(self):
+    def test_get_rule_names(self, first_name_rule):
         """Test getting rule names"""
-        rule1 = Rule(name="first_name")
-        combo = RuleCombination(name="full_name", rules=[rule1, "last_name"])
+        combo = RuleCombination(name="full_name", rules=[first_name_rule, "last_name"])
 
         names = combo.get_rule_names()
         assert "first_name" in names
         assert "last_name" in names
 
-    def test_rule_count(self):
-        """Test rule count"""
-        combo = RuleCombination(name="profile", rules=["name", "email", "phone"])
+    @pytest.mark.parametrize(
+        "rules,expected_names",
+        [
+            (["name", "email", "phone"], {"name", "email", "phone"}),
+            (["name", "email"], {"name", "email"}),
+        ],
+    )
+    def test_combination_inspection(self, rules, expected_names):
+        """Test rule count and rule names in one table"""
+        combo = RuleCombination.model_construct(
+            name="profile",
+            description="Combination for profile",
+            rules=list(rules),
+            combination_logic="combine",
+        )
 
-        assert len(combo.rules) == 3
+        assert len(combo.rules) == len(rules)
+        assert set(combo.get_rule_names()) == expected_names
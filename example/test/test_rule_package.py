@@ -5,10 +5,35 @@ Tests all functionality of the RulePackage class, including creation, validation
 """
 
 import pytest
+from .conftest import INVALID_CONTAINER_KWARGS
 from pydantic import ValidationError
 from shadow_ai import Rule, RuleCombination, RulePackage
 
 
+@pytest.fixture
+def product_package():
+    """Fresh two-rule package for the chain table (add_rule mutates in place)"""
+    return RulePackage(name="product", rules=["name", "price"])
+
+
+@pytest.fixture(scope="module")
+def user_profile():
+    """Shared read-only package for the prompt/dict assertions below"""
+    return RulePackage(name="user", rules=["name", "email", "age"])
+
+
+@pytest.fixture(scope="module")
+def user_profile_prompt(user_profile):
+    """Prompt text of user_profile, generated once for all needle checks"""
+    return user_profile.to_prompt()
+
+
+@pytest.fixture(scope="module")
+def user_profile_dict(user_profile):
+    """Dictionary form of user_profile, converted once for all key checks"""
+    return user_profile.to_dict()
+
+
 class TestRulePackageCreation:
     """Test RulePackage creation functionality"""
 
@@ -22,19 +47,15 @@ class TestRulePackageCreation:
         assert package.category is None
         assert package.version == "1.0.0"
 
-    def test_create_package_with_rule_objects(self):
+    def test_create_package_with_rule_objects(self, name_rule, email_rule, contact_combo):
         """Test creating RulePackage with Rule objects"""
-        rule1 = Rule(name="name")
-        rule2 = Rule(name="email")
-        combo = RuleCombination(name="contact", rules=["email", "phone"])
-
-        package = RulePackage(name="user_profile", rules=[rule1, rule2, combo])
+        package = RulePackage(name="user_profile", rules=[name_rule, email_rule, contact_combo])
 
         assert package.name == "user_profile"
         assert len(package.rules) == 3
-        assert package.rules[0] == rule1
-        assert package.rules[1] == rule2
-        assert package.rules[2] == combo
+        assert package.rules[0] == name_rule
+        assert package.rules[1] == email_rule
+        assert package.rules[2] == contact_combo
 
     def test_create_package_full_config(self):
         """Test creation with full configuration"""
@@ -52,17 +73,16 @@ class TestRulePackageCreation:
         assert package.category == "hr"
         assert package.version == "2.1.0"
 
-    def test_create_package_mixed_rules(self):
+    def test_create_package_mixed_rules(self, name_rule, contact_combo):
         """Test creating with mixed type rules"""
-        rule = Rule(name="name")
-        combo = RuleCombination(name="contact", rules=["email", "phone"])
-
-        package = RulePackage(name="mixed_package", rules=[rule, combo, "age", "location"])
+        package = RulePackage(
+            name="mixed_package", rules=[name_rule, contact_combo, "age", "location"]
+        )
 
         assert package.name == "mixed_package"
         assert len(package.rules) == 4
-        assert package.rules[0] == rule
-        assert package.rules[1] == combo
+        assert package.rules[0] == name_rule
+        assert package.rules[1] == contact_combo
         assert package.rules[2] == "age"
         assert package.rules[3] == "location"
 
@@ -70,42 +90,27 @@ class TestRulePackageCreation:
 class TestRulePackageAutoDescription:
     """Test RulePackage auto-description generation"""
 
-    def test_auto_description_simple(self):
-        """Test auto-description generation for simple package names"""
-        package = RulePackage(name="user", rules=["name", "email"])
-
-        assert package.description == "A collection of rules for user"
-
-    def test_auto_description_underscore_name(self):
-        """Test description generation for names with underscores"""
-        package = RulePackage(name="user_profile", rules=["name", "email"])
-
-        assert package.description == "A collection of rules for user profile"
-
-    def test_auto_description_complex_name(self):
-        """Test description generation for complex package names"""
-        package = RulePackage(name="employee_contact_info", rules=["name", "email", "phone"])
-
-        assert package.description == "A collection of rules for employee contact info"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("user", "A collection of rules for user"),
+            ("user_profile", "A collection of rules for user profile"),
+            ("employee_contact_info", "A collection of rules for employee contact info"),
+        ],
+    )
+    def test_auto_description(self, name, expected):
+        """Test auto-description generation across package-name shapes"""
+        assert RulePackage(name=name, rules=["name", "email"]).description == expected
 
 
 class TestRulePackageValidation:
     """Test RulePackage validation functionality"""
 
-    def test_empty_name_raises_error(self):
-        """Test empty name raises error"""
-        with pytest.raises(ValidationError):
-            RulePackage(name="", rules=["name"])
-
-    def test_none_name_raises_error(self):
-        """Test None name raises error"""
+    @pytest.mark.parametrize("kwargs", INVALID_CONTAINER_KWARGS)
+    def test_invalid_construction_raises_error(self, kwargs):
+        """Test invalid constructor arguments raise an error"""
         with pytest.raises((ValidationError, TypeError)):
-            RulePackage(name=None, rules=["name"])
-
-    def test_invalid_rules_type_raises_error(self):
-        """Test invalid rules type raises error"""
-        with pytest.raises(ValidationError):
-            RulePackage(name="test", rules="invalid")  # should be a list
+            RulePackage(**kwargs)
 
     def test_empty_rules_list_valid(self):
         """Test empty rules list is valid"""
@@ -140,82 +145,81 @@ class TestRulePackageSimpleCreation:
 class TestRulePackageFromRules:
     """Test RulePackage.from_rules() method"""
 
-    def test_from_rules_basic(self):
+    def test_from_rules_basic(self, name_rule, email_rule):
         """Test creating package from rules"""
-        rule1 = Rule(name="name")
-        rule2 = Rule(name="email")
-
-        package = RulePackage.from_rules("user", [rule1, rule2])
+        package = RulePackage.from_rules("user", [name_rule, email_rule])
 
         assert package.name == "user"
         assert len(package.rules) == 2
-        assert package.rules[0] == rule1
-        assert package.rules[1] == rule2
+        assert package.rules[0] == name_rule
+        assert package.rules[1] == email_rule
 
-    def test_from_rules_mixed(self):
+    def test_from_rules_mixed(self, name_rule, contact_combo):
         """Test creating package from mixed type rules"""
-        rule = Rule(name="name")
-        combo = RuleCombination(name="contact", rules=["email", "phone"])
-
-        package = RulePackage.from_rules("profile", [rule, combo, "age"])
+        package = RulePackage.from_rules("profile", [name_rule, contact_combo, "age"])
 
         assert package.name == "profile"
         assert len(package.rules) == 3
-        assert package.rules[0] == rule
-        assert package.rules[1] == combo
+        assert package.rules[0] == name_rule
+        assert package.rules[1] == contact_combo
         assert package.rules[2] == "age"
 
 
 class TestRulePackageChainMethods:
     """Test RulePackage chain methods"""
 
-    def test_add_rule_method(self):
+    def test_add_rule_method(self, base_package):
         """Test add_rule method"""
-        package = RulePackage(name="test", rules=["name"]).add_rule("email").add_rule("phone")
+        package = base_package.add_rule("email").add_rule("phone")
 
         assert len(package.rules) == 3
         assert "name" in package.rules
         assert "email" in package.rules
         assert "phone" in package.rules
 
-    def test_with_category_method(self):
+    def test_with_category_method(self, base_package):
         """Test with_category method"""
-        package = RulePackage(name="user", rules=["name", "email"]).with_category("users")
+        package = base_package.with_category("users")
 
         assert package.category == "users"
 
-    def test_with_version_method(self):
+    def test_with_version_method(self, base_package):
         """Test with_version method"""
-        package = RulePackage(name="user", rules=["name", "email"]).with_version("2.0.0")
+        package = base_package.with_version("2.0.0")
 
         assert package.version == "2.0.0"
 
-    def test_chain_multiple_methods(self):
+    @pytest.mark.parametrize(
+        "chain,checks",
+        [
+            (
+                (
+                    ("add_rule", "description"),
+                    ("with_category", "products"),
+                    ("with_version", "1.5.0"),
+                ),
+                {"category": "products", "version": "1.5.0"},
+            ),
+        ],
+    )
+    def test_chain_multiple_methods(self, product_package, chain, checks):
         """Test chaining multiple methods"""
-        package = (
-            RulePackage(name="product", rules=["name", "price"])
-            .add_rule("description")
-            .with_category("products")
-            .with_version("1.5.0")
-        )
+        package = product_package
+        for method, arg in chain:
+            package = getattr(package, method)(arg)
 
         assert len(package.rules) == 3
-        assert package.category == "products"
-        assert package.version == "1.5.0"
+        for attr, expected in checks.items():
+            assert getattr(package, attr) == expected
 
 
 class TestRulePackagePromptGeneration:
     """Test RulePackage prompt generation"""
 
-    def test_to_prompt_basic(self):
+    @pytest.mark.parametrize("needle", ["user", "name", "email", "age"])
+    def test_to_prompt_basic(self, user_profile_prompt, needle):
         """Test basic prompt generation"""
-        package = RulePackage(name="user", rules=["name", "email", "age"])
-        prompt = package.to_prompt()
-
-        assert "user" in prompt
-        assert "name" in prompt
-        assert "email" in prompt
-        assert "age" in prompt
+        assert needle in user_profile_prompt
 
     def test_to_prompt_with_category(self):
         """Test prompt generation with category"""
@@ -239,14 +243,17 @@ class TestRulePackagePromptGeneration:
 class TestRulePackageDictSerialization:
     """Test RulePackage dictionary serialization"""
 
-    def test_to_dict_basic(self):
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("name", "user"),
+            ("rules", ["name", "email", "age"]),
+            ("version", "1.0.0"),
+        ],
+    )
+    def test_to_dict_basic(self, user_profile_dict, key, expected):
         """Test basic dictionary conversion"""
-        package = RulePackage(name="user", rules=["name", "email"])
-        package_dict = package.to_dict()
-
-        assert package_dict["name"] == "user"
-        assert package_dict["rules"] == ["name", "email"]
-        assert package_dict["version"] == "1.0.0"
+        assert user_profile_dict[key] == expected
 
     def test_to_dict_full(self):
         """Test full dictionary conversion"""
@@ -265,60 +272,71 @@ class TestRulePackageDictSerialization:
         assert package_dict["category"] == "hr"
         assert package_dict["version"] == "2.0.0"
 
-    def test_to_dict_with_rule_objects(self):
+    def test_to_dict_with_rule_objects(self, name_rule):
         """Test dictionary conversion with Rule objects"""
-        rule = Rule(name="name")
-        package = RulePackage(name="profile", rules=[rule, "email"])
+        package = RulePackage(name="profile", rules=[name_rule, "email"])
         package_dict = package.to_dict()
 
-        # Rule objects should be converted
-        assert "name" in str(package_dict["rules"])
-        assert "email" in str(package_dict["rules"])
+        # Rule objects should be converted to string names or dictionaries;
+        # inspect the entries directly rather than stringifying the whole list
+        names = [r if isinstance(r, str) else r.get("name") for r in package_dict["rules"]]
+        assert "name" in names
+        assert "email" in names
 
 
 class TestRulePackageMethods:
     """Test other RulePackage methods"""
 
-    def test_get_rule_names(self):
+    def test_get_rule_names(self, first_name_rule, contact_combo):
         """Test getting rule names"""
-        rule = Rule(name="first_name")
-        combo = RuleCombination(name="contact", rules=["email", "phone"])
-
-        package = RulePackage(name="profile", rules=[rule, combo, "age"])
+        package = RulePackage(name="profile", rules=[first_name_rule, contact_combo, "age"])
 
         names = package.get_rule_names()
         assert "first_name" in names
         assert "contact" in names
         assert "age" in names
 
-    def test_rule_count(self):
-        """Test rule count"""
-        package = RulePackage(name="user", rules=["name", "email", "age", "phone"])
+    @pytest.mark.parametrize(
+        "rules,expected_names",
+        [
+            (["name", "email", "age", "phone"], {"name", "email", "age", "phone"}),
+            (["name", "email"], {"name", "email"}),
+        ],
+    )
+    def test_package_inspection(self, rules, expected_names):
+        """Test rule count, rule names and membership in one table"""
+        package = RulePackage.model_construct(
+            name="user",
+            description="A collection of rules for user",
+            rules=list(rules),
+            category=None,
+            version="1.0.0",
+            metadata=None,
+        )
 
-        assert len(package.rules) == 4
+        assert len(package.rules) == len(rules)
+        assert set(package.get_rule_names()) == expected_names
+        for rule_name in expected_names:
+            assert package.has_rule(rule_name)
 
-    def test_has_rule(self):
+    def test_has_rule(self, name_rule):
         """Test checking if package contains rule"""
-        rule = Rule(name="name")
-        package = RulePackage(name="profile", rules=[rule, "email"])
+        package = RulePackage(name="profile", rules=[name_rule, "email"])
 
         # Check if contains Rule object
-        assert rule in package.rules
+        assert name_rule in package.rules
         # Check if contains string rule
         assert "email" in package.rules
 
-    def test_get_rules_by_type(self):
+    def test_get_rules_by_type(self, name_rule, contact_combo):
         """Test getting rules by type"""
-        rule = Rule(name="name")
-        combo = RuleCombination(name="contact", rules=["email", "phone"])
-
-        package = RulePackage(name="profile", rules=[rule, combo, "age", "location"])
+        package = RulePackage(
+            name="profile", rules=[name_rule, contact_combo, "age", "location"]
+        )
 
-        # Count different types of rules
-        rule_objects = [r for r in package.rules if isinstance(r, Rule)]
-        combo_objects = [r for r in package.rules if isinstance(r, RuleCombination)]
-        string_rules = [r for r in package.rules if isinstance(r, str)]
+        # Single pass over the rules instead of one comprehension per type
+        groups = package.group_by_type()
 
-        assert len(rule_objects) == 1
-        assert len(combo_objects) == 1
-        assert len(string_rules) == 2
+        assert groups[Rule] == [name_rule]
+        assert groups[RuleCombination] == [contact_combo]
+        assert groups[str] == ["age", "location"]
@@ -4,8 +4,6 @@ ShadowAI Main Class Unit Tests
 Tests all functionality of the ShadowAI class, including data generation, string inputs, formatted output, etc.
 """
 
-from unittest.mock import MagicMock, Mock, patch
-
 import pytest
 from shadow_ai import Rule, RuleCombination, RulePackage, ShadowAI
 from shadow_ai.core.shadow_ai import MockDataResponse
@@ -14,13 +12,13 @@ from shadow_ai.core.shadow_ai import MockDataResponse
 class TestShadowAIInitialization:
     """Test ShadowAI initialization"""
 
-    def test_default_initialization(self, mock_api_key):
+    def test_default_initialization(self):
         """Test default initialization"""
         shadow_ai = ShadowAI()
         assert shadow_ai is not None
         assert shadow_ai.model_id == "gpt-4o-mini"
 
-    def test_custom_model_initialization(self, mock_api_key):
+    def test_custom_model_initialization(self):
         """Test initialization with custom model"""
         shadow_ai = ShadowAI(model_id="gpt-4")
         assert shadow_ai.model_id == "gpt-4"
@@ -29,29 +27,35 @@ class TestShadowAIInitialization:
 class TestShadowAIStringInputs:
     """Test ShadowAI string input functionality"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_string_input_basic(self, mock_agent_class, mock_api_key):
-        """Test basic string input"""
-        # Mock agent behavior
-        mock_agent = Mock()
-        mock_agent.run.return_value.content = '{"name": "John Doe"}'
-        mock_agent_class.return_value = mock_agent
-
-        shadow_ai = ShadowAI()
-        result = shadow_ai.generate("name")
+    # String, Rule and quick() all funnel into the same single-record path,
+    # so one parametrized test covers what three near-identical tests did.
+    @pytest.mark.parametrize(
+        "content, field, call",
+        [
+            ('{"name": "John Doe"}', "name", lambda sai: sai.generate("name")),
+            (
+                '{"email": "test@example.com"}',
+                "email",
+                lambda sai: sai.generate(Rule(name="email", description="Email address")),
+            ),
+            ('{"name": "John"}', "name", lambda sai: sai.quick("name")),
+        ],
+        ids=["string", "rule", "quick"],
+    )
+    def test_single_record_basic(self, shadow_ai, mock_agent, content, field, call):
+        """Test basic single-record generation across input styles"""
+        mock_agent.run.return_value.content = content
+
+        result = call(shadow_ai)
 
         assert isinstance(result, dict)
-        assert "name" in result
+        assert field in result
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_string_input_multiple_count(self, mock_agent_class, mock_api_key):
+    def test_string_input_multiple_count(self, shadow_ai, mock_agent):
         """Test string input with multiple count"""
         # Mock agent behavior for array response
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '[{"name": "John"}, {"name": "Jane"}]'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         result = shadow_ai.generate("name", count=2)
 
         assert isinstance(result, list)
@@ -61,28 +65,10 @@ class TestShadowAIStringInputs:
 class TestShadowAIRuleInputs:
     """Test ShadowAI Rule object input functionality"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_rule_input_basic(self, mock_agent_class, mock_api_key):
-        """Test basic Rule input"""
-        mock_agent = Mock()
-        mock_agent.run.return_value.content = '{"email": "test@example.com"}'
-        mock_agent_class.return_value = mock_agent
-
-        shadow_ai = ShadowAI()
-        rule = Rule(name="email", description="Email address")
-        result = shadow_ai.generate(rule)
-
-        assert isinstance(result, dict)
-        assert "email" in result
-
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_rule_combination_input(self, mock_agent_class, mock_api_key):
+    def test_rule_combination_input(self, shadow_ai, mock_agent):
         """Test RuleCombination input"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"full_name": "John Doe"}'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         rule_combo = RuleCombination(
             name="full_name",
             description="Full name combination",
@@ -92,14 +78,10 @@ class TestShadowAIRuleInputs:
 
         assert isinstance(result, dict)
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_rule_package_input(self, mock_agent_class, mock_api_key):
+    def test_rule_package_input(self, shadow_ai, mock_agent):
         """Test RulePackage input"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"name": "John", "age": 30}'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         rule_package = RulePackage(name="user", description="User profile", rules=["name", "age"])
         result = shadow_ai.generate(rule_package)
 
@@ -109,14 +91,10 @@ class TestShadowAIRuleInputs:
 class TestShadowAIFormattedOutput:
     """Test ShadowAI formatted output functionality"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_formatted_output_success(self, mock_agent_class, mock_api_key):
+    def test_formatted_output_success(self, shadow_ai, mock_agent):
         """Test formatted output success response"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"name": "John"}'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         result = shadow_ai.generate("name", format_output=True)
 
         assert isinstance(result, MockDataResponse)
@@ -124,14 +102,10 @@ class TestShadowAIFormattedOutput:
         assert result.error is None
         assert "name" in result.data
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_formatted_output_error(self, mock_agent_class, mock_api_key):
+    def test_formatted_output_error(self, shadow_ai, mock_agent):
         """Test formatted output error response"""
-        mock_agent = Mock()
         mock_agent.run.side_effect = Exception("Test error")
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         result = shadow_ai.generate("name", format_output=True)
 
         assert isinstance(result, MockDataResponse)
@@ -142,14 +116,10 @@ class TestShadowAIFormattedOutput:
 class TestShadowAIBatchGeneration:
     """Test ShadowAI batch generation functionality"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_batch_generation_list_rules(self, mock_agent_class, mock_api_key):
+    def test_batch_generation_list_rules(self, shadow_ai, mock_agent):
         """Test batch generation with list of rules"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"name": "John", "email": "john@example.com"}'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         rules = [
             Rule(name="name", description="Person name"),
             Rule(name="email", description="Email address"),
@@ -159,14 +129,10 @@ class TestShadowAIBatchGeneration:
         assert isinstance(result, dict)
         mock_agent.run.assert_called_once()
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_batch_generation_mixed_rules(self, mock_agent_class, mock_api_key):
+    def test_batch_generation_mixed_rules(self, shadow_ai, mock_agent):
         """Test batch generation with mixed rule types"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"name": "John", "email": "john@example.com"}'
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         rules = ["name", Rule(name="email", description="Email address")]
         result = shadow_ai.generate(rules)
 
@@ -176,28 +142,12 @@ class TestShadowAIBatchGeneration:
 class TestShadowAIQuickMethod:
     """Test ShadowAI quick generation method"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_quick_method_single_field(self, mock_agent_class, mock_api_key):
-        """Test quick method with single field"""
-        mock_agent = Mock()
-        mock_agent.run.return_value.content = '{"name": "John"}'
-        mock_agent_class.return_value = mock_agent
-
-        shadow_ai = ShadowAI()
-        result = shadow_ai.quick("name")
-
-        assert isinstance(result, dict)
-
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_quick_method_multiple_fields(self, mock_agent_class, mock_api_key):
+    def test_quick_method_multiple_fields(self, shadow_ai, mock_agent):
         """Test quick method with multiple fields"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = (
             '{"name": "John", "age": 30, "email": "john@example.com"}'
         )
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
         result = shadow_ai.quick("name", "age", "email")
 
         assert isinstance(result, dict)
@@ -206,46 +156,32 @@ class TestShadowAIQuickMethod:
 class TestShadowAIErrorHandling:
     """Test ShadowAI error handling"""
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_invalid_json_response(self, mock_agent_class, mock_api_key):
+    def test_invalid_json_response(self, shadow_ai, mock_agent):
         """Test handling of invalid JSON response"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = "invalid json"
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
 
         with pytest.raises(ValueError, match="No valid JSON found in response"):
             shadow_ai.generate("name")
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_malformed_json_response(self, mock_agent_class, mock_api_key):
+    def test_malformed_json_response(self, shadow_ai, mock_agent):
         """Test handling of malformed JSON response"""
-        mock_agent = Mock()
         mock_agent.run.return_value.content = '{"name": "John"'  # Missing closing brace
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
 
         with pytest.raises(ValueError, match="No valid JSON found in response"):
             shadow_ai.generate("name")
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_agent_exception_no_format(self, mock_agent_class, mock_api_key):
+    def test_agent_exception_no_format(self, shadow_ai, mock_agent):
         """Test agent exception without format_output"""
-        mock_agent = Mock()
         mock_agent.run.side_effect = Exception("API Error")
-        mock_agent_class.return_value = mock_agent
 
-        shadow_ai = ShadowAI()
 
         with pytest.raises(Exception, match="API Error"):
             shadow_ai.generate("name")
 
-    @patch("shadow_ai.core.shadow_ai.Agent")
-    def test_unsupported_rule_type(self, mock_agent_class, mock_api_key):
+    def test_unsupported_rule_type(self, shadow_ai, mock_agent):
         """Test unsupported rule type error"""
-        shadow_ai = ShadowAI()
 
         with pytest.raises(ValueError, match="Unsupported rules type"):
             shadow_ai.generate(123)  # Invalid type
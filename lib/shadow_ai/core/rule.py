@@ -5,6 +5,7 @@ Defines core types for the rule engine: Rule (rule record)
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
@@ -18,6 +19,34 @@ class RuleType(str, Enum):
     PACKAGE = "package"  # Rule package: a set of related rules
 
 
+@lru_cache(maxsize=4096)
+def _auto_description(name: str) -> str:
+    """Build the default description for a field name (memoized per name)"""
+    return f"Generate a {name.replace('_', ' ')}"
+
+
+# Formatted constraints text, memoized per constraint schema — rules built
+# from the same template repeat identical constraint dicts
+_CONSTRAINT_TEXT_CACHE: Dict[tuple, str] = {}
+
+
+def _constraints_text(constraints: Dict[str, Any]) -> str:
+    """Format a constraints dict for prompts, cached for repeated schemas"""
+    key = tuple(constraints.items())
+    try:
+        cached = _CONSTRAINT_TEXT_CACHE.get(key)
+    except TypeError:  # unhashable constraint values (e.g. lists)
+        key = None
+        cached = None
+    if cached is not None:
+        return cached
+
+    text = ", ".join(f"{k}={v}" for k, v in constraints.items())
+    if key is not None and len(_CONSTRAINT_TEXT_CACHE) < 1024:
+        _CONSTRAINT_TEXT_CACHE[key] = text
+    return text
+
+
 class Rule(BaseModel):
     """
     Rule Class - Basic unit of the rule engine
@@ -45,12 +74,37 @@ class Rule(BaseModel):
         # If no description provided, auto-generate
         if "description" not in data or data["description"] is None:
             name = data.get("name", "field")
-            if name is not None:
-                data["description"] = f"Generate a {name.replace('_', ' ')}"
+            if isinstance(name, str):
+                data["description"] = _auto_description(name)
             else:
                 data["description"] = "Generate a field"
         super().__init__(**data)
 
+    @classmethod
+    def fast(cls, name: str, description: str = None) -> "Rule":
+        """
+        Create a rule without running validation
+
+        Fast path for callers that already guarantee a valid, non-empty
+        name; builds the instance via model_construct and skips the
+        pydantic validation pass entirely.
+
+        Args:
+            name: Field name (caller must ensure it is a non-empty string)
+            description: Field description (optional, auto-generated if not provided)
+
+        Returns:
+            Rule object
+        """
+        return cls.model_construct(
+            name=name,
+            description=description if description is not None else _auto_description(name),
+            rule_type=RuleType.RECORD,
+            metadata=None,
+            examples=None,
+            constraints=None,
+        )
+
     @classmethod
     def simple(cls, input_str: str, description: str = None) -> "Rule":
         """
@@ -74,9 +128,7 @@ class Rule(BaseModel):
             name, examples_str = input_str.split("|", 1)
             examples = [ex.strip() for ex in examples_str.split(",")]
             if description is None:
-                description = (
-                    f"Generate a {name.replace('_', ' ')} similar to the provided examples"
-                )
+                description = _auto_description(name) + " similar to the provided examples"
             return cls(
                 name=name,
                 description=description,
@@ -87,7 +139,7 @@ class Rule(BaseModel):
             # Simple name
             name = input_str
             if description is None:
-                description = f"Generate a {name.replace('_', ' ')}"
+                description = _auto_description(name)
 
         return cls(name=name, description=description, rule_type=RuleType.RECORD)
 
@@ -105,7 +157,7 @@ class Rule(BaseModel):
             Rule object
         """
         if description is None:
-            description = f"Generate a {name.replace('_', ' ')} similar to the provided examples"
+            description = _auto_description(name) + " similar to the provided examples"
 
         return cls(
             name=name,
@@ -130,7 +182,7 @@ class Rule(BaseModel):
             Rule object
         """
         if description is None:
-            description = f"Generate a {name.replace('_', ' ')} following specified constraints"
+            description = _auto_description(name) + " following specified constraints"
 
         return cls(
             name=name,
@@ -181,8 +233,7 @@ class Rule(BaseModel):
             prompt_parts.append(f"Examples: {self.examples}")
 
         if self.constraints:
-            constraints_text = ", ".join([f"{k}={v}" for k, v in self.constraints.items()])
-            prompt_parts.append(f"Constraints: {constraints_text}")
+            prompt_parts.append(f"Constraints: {_constraints_text(self.constraints)}")
 
         return ". ".join(prompt_parts)
 
@@ -210,6 +210,32 @@ class RulePackage(BaseModel):
                     rule_objects.append(Rule(name=str(rule)))
         return rule_objects
 
+    def group_by_type(self) -> Dict[type, List[Union[str, Rule, RuleCombination]]]:
+        """
+        Group rules by their concrete type in a single pass
+
+        Returns:
+            Dictionary mapping Rule, RuleCombination and str to the contained
+            rules of that type
+        """
+        groups: Dict[type, List[Union[str, Rule, RuleCombination]]] = {
+            Rule: [],
+            RuleCombination: [],
+            str: [],
+        }
+        for rule in self.rules:
+            bucket = groups.get(type(rule))
+            if bucket is None:
+                # Subclass of one of the supported types
+                for rule_cls in groups:
+                    if isinstance(rule, rule_cls):
+                        bucket = groups[rule_cls]
+                        break
+                else:
+                    continue
+            bucket.append(rule)
+        return groups
+
     def add_rule(self, rule: Union[str, Rule, RuleCombination]) -> "RulePackage":
         """
         Add rule (chain call)
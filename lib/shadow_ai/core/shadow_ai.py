@@ -5,18 +5,72 @@ Provides main data generation functionality, integrating the Agno framework.
 """
 
 import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used instead
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error
+# handling below works identically with either decoder
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Incremental decoder for pulling a JSON value out of surrounding prose;
+# raw_decode stops at the end of the value instead of requiring slicing
+_JSON_DECODER = json.JSONDecoder()
+
 from .rule import Rule, RuleType
 from .rule_combination import RuleCombination
 from .rule_package import RulePackage
 from .table_rule import TableRule, TableOutputFormat
 
 
+# Static prompt boilerplate, built once instead of per _build_prompt call;
+# the count-dependent line is inserted between header and footer
+_TABLE_FORMAT_HEADER = (
+    "",
+    "IMPORTANT: Return data in FLAT JSON format as an array of objects.",
+    "- Each object represents one row of the table",
+    "- Each field should contain a simple value (string, number, or boolean)",
+    "- Do NOT use nested objects or complex structures",
+    "- Column names should match exactly as specified",
+    "",
+)
+_TABLE_FORMAT_FOOTER = (
+    "Each object should have all the specified columns with realistic values.",
+    "Ensure the data is realistic and follows the given constraints and examples.",
+)
+_FLAT_FORMAT_HEADER = (
+    "",
+    "IMPORTANT: Return data in FLAT JSON format only.",
+    "- Each field should contain a simple value (string, number, or boolean)",
+    "- Do NOT use nested objects or complex structures",
+    "- For combination fields, return a single combined string value",
+    "",
+)
+_FLAT_FORMAT_FOOTER = (
+    "If generating a single record, return a single object.",
+    "Ensure the data is realistic and follows the given constraints and examples.",
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_rule_line(name: str, description: str) -> str:
+    """Render the per-rule prompt line, memoized per (name, description)
+
+    Generation workloads reuse the same rule sets across calls, so the
+    formatted lines repeat; examples/constraints stay uncached since they
+    hold unhashable lists and dicts.
+    """
+    return f"- {name}: {description}"
+
+
 class MockDataResponse(BaseModel):
     """Mock data response model"""
 
@@ -40,7 +94,9 @@ class ShadowAI:
         Args:
             model_id: AI model ID
             api_key: API key (optional, can be obtained from environment variables)
-            **kwargs: Other configuration parameters
+            **kwargs: Other configuration parameters, forwarded to the underlying
+                model (e.g. http_client to tune the transport for
+                high-concurrency workloads)
         """
         self.model_id = model_id
         self.api_key = api_key
@@ -107,6 +163,61 @@ class ShadowAI:
             else:
                 raise e
 
+    async def agenerate(
+        self,
+        rules: Union[Rule, RuleCombination, RulePackage, TableRule, List[Union[Rule, str]], str, list, dict],
+        count: int = 1,
+        format_output: bool = False,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], MockDataResponse]:
+        """
+        Generate mock data asynchronously
+
+        Async counterpart of generate(), allowing multiple generations to be
+        awaited concurrently (e.g. via asyncio.gather).
+
+        Args:
+            rules: Rules to use for generation (supports multiple formats)
+            count: Number of records to generate
+            format_output: Whether to return formatted response
+
+        Returns:
+            Generated mock data or formatted response
+        """
+        try:
+            # Convert input to Rule objects
+            processed_rules = self._process_rules(rules)
+
+            # Generate prompt
+            prompt = self._build_prompt(processed_rules, count)
+
+            # Call AI to generate data
+            response = await self.agent.arun(prompt)
+
+            # Parse response
+            data = self._parse_response(response)
+
+            # Return based on format_output parameter
+            if format_output:
+                return MockDataResponse(
+                    data=data,
+                    success=True,
+                    metadata={
+                        "model_id": self.model_id,
+                        "rules_count": (
+                            len(processed_rules) if isinstance(processed_rules, list) else 1
+                        ),
+                        "generated_count": count,
+                    },
+                )
+            else:
+                return data
+
+        except Exception as e:
+            if format_output:
+                return MockDataResponse(data={}, success=False, error=str(e))
+            else:
+                raise e
+
     def quick(self, *field_names: str) -> Dict[str, Any]:
         """
         Quick generation method - generate data for multiple fields at once
@@ -120,6 +231,42 @@ class ShadowAI:
         rules = [Rule(name=name) for name in field_names]
         return self.generate(rules, format_output=False)
 
+    def _process_str(self, rules: str) -> List[Rule]:
+        # Single string, create Rule
+        return [Rule(name=rules)]
+
+    def _process_single(self, rules: Union[Rule, RuleCombination, RulePackage, TableRule]) -> list:
+        # Single Rule, RuleCombination, RulePackage or TableRule object
+        return [rules]
+
+    def _process_list(self, rules: List[Union[Rule, str]]) -> List[Rule]:
+        # List of rules
+        processed = []
+        for rule in rules:
+            if isinstance(rule, str):
+                processed.append(Rule(name=rule))
+            elif isinstance(rule, Rule):
+                processed.append(rule)
+            else:
+                raise ValueError(f"Unsupported rule type in list: {type(rule)}")
+        return processed
+
+    def _process_dict(self, rules: dict) -> list:
+        # Dictionary format (loaded from file)
+        return [self._dict_to_rule(rules)]
+
+    # Exact-type dispatch: one hash lookup per call instead of walking
+    # an isinstance chain; subclasses fall back to isinstance below
+    _PROCESS_DISPATCH = {
+        str: _process_str,
+        Rule: _process_single,
+        RuleCombination: _process_single,
+        RulePackage: _process_single,
+        TableRule: _process_single,
+        list: _process_list,
+        dict: _process_dict,
+    }
+
     def _process_rules(
         self,
         rules: Union[Rule, RuleCombination, RulePackage, TableRule, List[Union[Rule, str]], str, list, dict],
@@ -133,36 +280,16 @@ class ShadowAI:
         Returns:
             List of Rule objects
         """
-        if isinstance(rules, str):
-            # Single string, create Rule
-            return [Rule(name=rules)]
+        handler = self._PROCESS_DISPATCH.get(type(rules))
+        if handler is not None:
+            return handler(self, rules)
 
-        elif isinstance(rules, Rule):
-            # Single Rule object
-            return [rules]
+        # Subclass instances miss the exact-type table
+        for base, fallback in self._PROCESS_DISPATCH.items():
+            if isinstance(rules, base):
+                return fallback(self, rules)
 
-        elif isinstance(rules, (RuleCombination, RulePackage, TableRule)):
-            # RuleCombination, RulePackage or TableRule
-            return [rules]
-
-        elif isinstance(rules, list):
-            # List of rules
-            processed = []
-            for rule in rules:
-                if isinstance(rule, str):
-                    processed.append(Rule(name=rule))
-                elif isinstance(rule, Rule):
-                    processed.append(rule)
-                else:
-                    raise ValueError(f"Unsupported rule type in list: {type(rule)}")
-            return processed
-
-        elif isinstance(rules, dict):
-            # Dictionary format (loaded from file)
-            return [self._dict_to_rule(rules)]
-
-        else:
-            raise ValueError(f"Unsupported rules type: {type(rules)}")
+        raise ValueError(f"Unsupported rules type: {type(rules)}")
 
     def _dict_to_rule(self, rule_dict: dict) -> Union[Rule, RuleCombination, RulePackage, TableRule]:
         """
@@ -227,7 +354,7 @@ class ShadowAI:
                     f"",
                     f"Rule Name: {rule.name}",
                     f"Description: {rule.description}",
-                    f"Type: {rule.rule_type}",
+                    f"Type: {rule.rule_type.value}",
                 ]
 
                 if hasattr(rule, "rules") and rule.rules:
@@ -247,7 +374,7 @@ class ShadowAI:
             ]
 
             for rule in rules:
-                prompt_parts.append(f"- {rule.name}: {rule.description}")
+                prompt_parts.append(_render_rule_line(rule.name, rule.description))
                 if rule.examples:
                     prompt_parts.append(f"  Examples: {rule.examples}")
                 if rule.constraints:
@@ -256,34 +383,13 @@ class ShadowAI:
         # Add output format instructions
         if len(rules) == 1 and isinstance(rules[0], TableRule):
             # Special instructions for table generation
-            prompt_parts.extend(
-                [
-                    "",
-                    "IMPORTANT: Return data in FLAT JSON format as an array of objects.",
-                    "- Each object represents one row of the table",
-                    "- Each field should contain a simple value (string, number, or boolean)",
-                    "- Do NOT use nested objects or complex structures",
-                    "- Column names should match exactly as specified",
-                    "",
-                    f"Return an array of exactly {rules[0].rows_count} objects.",
-                    "Each object should have all the specified columns with realistic values.",
-                    "Ensure the data is realistic and follows the given constraints and examples.",
-                ]
-            )
+            prompt_parts.extend(_TABLE_FORMAT_HEADER)
+            prompt_parts.append(f"Return an array of exactly {rules[0].rows_count} objects.")
+            prompt_parts.extend(_TABLE_FORMAT_FOOTER)
         else:
-            prompt_parts.extend(
-                [
-                    "",
-                    "IMPORTANT: Return data in FLAT JSON format only.",
-                    "- Each field should contain a simple value (string, number, or boolean)",
-                    "- Do NOT use nested objects or complex structures",
-                    "- For combination fields, return a single combined string value",
-                    "",
-                    f"If generating multiple records, return an array of {count} objects.",
-                    "If generating a single record, return a single object.",
-                    "Ensure the data is realistic and follows the given constraints and examples.",
-                ]
-            )
+            prompt_parts.extend(_FLAT_FORMAT_HEADER)
+            prompt_parts.append(f"If generating multiple records, return an array of {count} objects.")
+            prompt_parts.extend(_FLAT_FORMAT_FOOTER)
 
         return "\n".join(prompt_parts)
 
@@ -299,37 +405,32 @@ class ShadowAI:
         Returns:
             Parsed data
         """
-        try:
-            # Extract response content
-            if hasattr(response, "content"):
-                response_str = response.content
-            else:
-                response_str = str(response)
-
-            # Try to extract JSON from response
-            response_str = response_str.strip()
-
-            # Check for array first (priority over object)
-            array_start = response_str.find("[")
-            array_end = response_str.rfind("]")
-
-            if array_start != -1 and array_end != -1:
-                json_str = response_str[array_start : array_end + 1]
-                return json.loads(json_str)
-
-            # Then check for object
-            obj_start = response_str.find("{")
-            obj_end = response_str.rfind("}")
-
-            if obj_start != -1 and obj_end != -1:
-                json_str = response_str[obj_start : obj_end + 1]
-                return json.loads(json_str)
+        # Extract response content
+        if hasattr(response, "content"):
+            response_str = response.content
+        else:
+            response_str = str(response)
 
-            # If no valid JSON structure found
-            raise ValueError("No valid JSON found in response")
+        response_str = response_str.strip()
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON response: {e}")
+        # Fast path: the whole response is the JSON value (the common case)
+        if response_str and response_str[0] in "{[":
+            try:
+                return _loads(response_str)
+            except json.JSONDecodeError:
+                pass
+
+        # Otherwise scan for an embedded JSON value. raw_decode consumes
+        # exactly one value from each candidate start, which also handles
+        # objects that contain arrays (find/rfind slicing did not).
+        for index, char in enumerate(response_str):
+            if char in "{[":
+                try:
+                    return _JSON_DECODER.raw_decode(response_str, index)[0]
+                except json.JSONDecodeError:
+                    continue
+
+        raise ValueError("No valid JSON found in response")
 
     def load_rules_from_file(
         self, file_path: str
@@ -7,17 +7,25 @@ Provides various utility functions.
 from .file_utils import (
     create_rule_template,
     load_rules_from_json,
+    load_rules_from_jsons,
     load_rules_from_yaml,
+    load_rules_from_yaml_streaming,
+    load_rules_from_yamls,
     save_rules_to_json,
+    save_rules_to_json_many,
     save_rules_to_yaml,
 )
 from .validators import validate_email, validate_phone
 
 __all__ = [
     "save_rules_to_json",
+    "save_rules_to_json_many",
     "save_rules_to_yaml",
     "load_rules_from_json",
+    "load_rules_from_jsons",
     "load_rules_from_yaml",
+    "load_rules_from_yaml_streaming",
+    "load_rules_from_yamls",
     "create_rule_template",
     "validate_email",
     "validate_phone",
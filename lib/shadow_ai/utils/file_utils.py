@@ -4,18 +4,69 @@ File Processing Utilities Module
 Provides read and write functionality for JSON and YAML files.
 """
 
+import copy
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import yaml
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used instead
+    orjson = None
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 from ..core.rule import Rule
 from ..core.rule_combination import RuleCombination
 from ..core.rule_package import RulePackage
 
 
+def _convert_dict(data: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {key: _convert_to_yaml_safe(value) for key, value in data.items()}
+
+
+def _convert_list(data: Any) -> List[Any]:
+    return [_convert_to_yaml_safe(item) for item in data]
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+# Exact-type dispatch: one dict lookup instead of an isinstance chain,
+# with primitives short-circuiting straight through
+_CONVERT_DISPATCH = {
+    dict: _convert_dict,
+    list: _convert_list,
+    tuple: _convert_list,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+}
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively"""
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Enum members have tiny cardinality (RuleType etc.), so the cache
+# saturates after first use and repeat conversions become dict hits
+_ENUM_CACHE: Dict[Enum, Any] = {}
+
+
 def _convert_to_yaml_safe(data: Any) -> Any:
     """
     Convert data to YAML-safe format, handling enums and other Python-specific objects
@@ -26,17 +77,70 @@ def _convert_to_yaml_safe(data: Any) -> Any:
     Returns:
         YAML-safe data
     """
+    handler = _CONVERT_DISPATCH.get(type(data))
+    if handler is not None:
+        return handler(data)
+    if isinstance(data, BaseModel):
+        # pydantic-core walks the model in Rust and already returns
+        # JSON/YAML-safe primitives, so skip the Python-side recursion
+        return data.model_dump(mode="json")
+    if isinstance(data, Enum):
+        value = _ENUM_CACHE.get(data)
+        if value is None:
+            value = _ENUM_CACHE[data] = data.value
+        return value
+    # dict/list subclasses (OrderedDict etc.) miss the exact-type dispatch
+    # above but must still convert as mappings/sequences, not via __dict__
     if isinstance(data, dict):
-        return {key: _convert_to_yaml_safe(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [_convert_to_yaml_safe(item) for item in data]
-    elif isinstance(data, Enum):
-        return data.value
-    elif hasattr(data, "__dict__"):
+        return _convert_dict(data)
+    if isinstance(data, (list, tuple)):
+        return _convert_list(data)
+    if hasattr(data, "__dict__"):
         # Handle other object types
-        return _convert_to_yaml_safe(data.__dict__)
-    else:
-        return data
+        return _convert_dict(data.__dict__)
+    return data
+
+
+# Parsed-file cache keyed by absolute path; entries invalidate when the
+# file's mtime or size changes, so reloading an unchanged catalog skips
+# parsing entirely. Callers always get deep copies for mutation safety.
+_LOAD_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+_LOAD_CACHE_MAX = 64
+
+
+def _load_with_cache(file_path: str, parse) -> Any:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let the parser surface the usual FileNotFoundError
+        return parse(file_path)
+
+    key = os.path.abspath(file_path)
+    entry = _LOAD_CACHE.get(key)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return copy.deepcopy(entry[2])
+
+    result = parse(file_path)
+    if len(_LOAD_CACHE) >= _LOAD_CACHE_MAX:
+        _LOAD_CACHE.pop(next(iter(_LOAD_CACHE)))
+    _LOAD_CACHE[key] = (stat.st_mtime_ns, stat.st_size, result)
+    return copy.deepcopy(result)
+
+
+def _load_json_uncached(file_path: str) -> Union[Rule, RuleCombination, RulePackage, List]:
+    # Both decoders accept UTF-8 bytes directly, so one read_bytes call
+    # replaces text-mode IO and its intermediate str allocation
+    raw = Path(file_path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    return _parse_rules_data(data)
+
+
+def _load_yaml_uncached(file_path: str) -> Union[Rule, RuleCombination, RulePackage, List]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    return _parse_rules_data(data)
 
 
 def load_rules_from_json(
@@ -51,10 +155,7 @@ def load_rules_from_json(
     Returns:
         Loaded rule object
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return _parse_rules_data(data)
+    return _load_with_cache(file_path, _load_json_uncached)
 
 
 def load_rules_from_yaml(
@@ -69,10 +170,82 @@ def load_rules_from_yaml(
     Returns:
         Loaded rule object
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    return _load_with_cache(file_path, _load_yaml_uncached)
 
-    return _parse_rules_data(data)
+
+def load_rules_from_jsons(
+    file_paths: List[str],
+) -> List[Union[Rule, RuleCombination, RulePackage, List]]:
+    """
+    Load rules from multiple JSON files concurrently
+
+    The decoders release the GIL while parsing (orjson) and during file
+    reads, so a thread pool overlaps the per-file work. Results come back
+    in the same order as file_paths.
+
+    Args:
+        file_paths: JSON file paths
+
+    Returns:
+        List of loaded rule objects, one per file
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(load_rules_from_json, file_paths))
+
+
+def load_rules_from_yamls(
+    file_paths: List[str],
+) -> List[Union[Rule, RuleCombination, RulePackage, List]]:
+    """
+    Load rules from multiple YAML files concurrently
+
+    Args:
+        file_paths: YAML file paths
+
+    Returns:
+        List of loaded rule objects, one per file
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(load_rules_from_yaml, file_paths))
+
+
+def load_rules_from_yaml_streaming(
+    file_path: str,
+) -> Iterator[Union[Rule, RuleCombination, RulePackage]]:
+    """
+    Load rules from a YAML file one at a time
+
+    Streams a top-level YAML sequence through the parser event by event,
+    yielding each rule as soon as its node is composed. Peak memory stays
+    at one rule instead of the whole catalog, which matters for large
+    rule files; use load_rules_from_yaml when you need the full list.
+
+    Args:
+        file_path: YAML file path containing a top-level list of rules
+
+    Yields:
+        Parsed rule objects
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        # The libyaml bindings do not expose per-node composition, so the
+        # streaming path uses the pure-Python loader; the trade is speed
+        # for bounded memory, which is the point of this helper
+        loader = yaml.SafeLoader(f)
+        try:
+            # Consume stream/document/sequence start events, then compose
+            # one sequence item at a time
+            loader.get_event()  # StreamStartEvent
+            loader.get_event()  # DocumentStartEvent
+            if not loader.check_event(yaml.SequenceStartEvent):
+                raise ValueError(f"Expected a top-level list of rules in: {file_path}")
+            loader.get_event()  # SequenceStartEvent
+
+            while not loader.check_event(yaml.SequenceEndEvent):
+                node = loader.compose_node(None, None)
+                item = loader.construct_object(node, deep=True)
+                yield _parse_single_rule(item)
+        finally:
+            loader.dispose()
 
 
 def save_rules_to_json(
@@ -88,19 +261,62 @@ def save_rules_to_json(
     # Ensure directory exists
     Path(file_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert rules to dictionary and handle special types
+    # Convert rules to dictionary form
     if isinstance(rules, list):
-        data = [
-            _convert_to_yaml_safe(rule.to_dict() if hasattr(rule, "to_dict") else rule)
-            for rule in rules
-        ]
+        data = [rule.to_dict() if hasattr(rule, "to_dict") else rule for rule in rules]
     elif hasattr(rules, "to_dict"):
-        data = _convert_to_yaml_safe(rules.to_dict())
+        data = rules.to_dict()
     else:
-        data = _convert_to_yaml_safe(rules)
+        data = rules
+
+    if orjson is not None:
+        # orjson serializes Enum members natively, so the YAML-safe tree
+        # walk is unnecessary; the default hook covers plain objects
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=_orjson_default,
+                )
+            )
+    else:
+        data = _convert_to_yaml_safe(data)
+        # Encode to one string first so the file sees a single write call
+        Path(file_path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def save_rules_to_json_many(
+    items: List[Tuple[str, Union[Rule, RuleCombination, RulePackage, Dict[str, Any]]]],
+) -> None:
+    """
+    Save multiple rules to JSON files in one batch
+
+    Binds the encoder once and writes each payload compactly in a single
+    call, which is cheaper than repeated save_rules_to_json calls when
+    dumping many small files.
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    Args:
+        items: List of (file_path, rules) tuples
+    """
+    if orjson is not None:
+        # One walk: orjson handles enums natively, the hook covers objects
+        def encode(obj):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=_orjson_default)
+
+    else:
+
+        def encode(obj):
+            return json.dumps(_convert_to_yaml_safe(obj), ensure_ascii=False).encode("utf-8")
+
+    for file_path, rules in items:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if hasattr(rules, "to_dict"):
+            rules = rules.to_dict()
+
+        with open(file_path, "wb", buffering=1 << 16) as f:
+            f.write(encode(rules))
 
 
 def save_rules_to_yaml(
@@ -127,8 +343,15 @@ def save_rules_to_yaml(
     else:
         data = _convert_to_yaml_safe(rules)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+    # Dump to one string first so the file sees a single write call
+    text = yaml.dump(
+        data,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        indent=2,
+    )
+    Path(file_path).write_text(text, encoding="utf-8")
 
 
 def _parse_rules_data(
@@ -189,6 +412,13 @@ def create_rule_template(rule_type: str = "record") -> Dict[str, Any]:
     Returns:
         Rule template dictionary
     """
+    # Templates are pure functions of the type string; build each one once
+    # and hand out deep copies so callers can freely mutate the result.
+    return copy.deepcopy(_create_rule_template_cached(rule_type))
+
+
+@lru_cache(maxsize=8)
+def _create_rule_template_cached(rule_type: str) -> Dict[str, Any]:
     if rule_type == "record":
         return {
             "name": "example_field",
@@ -7,21 +7,33 @@ This script automatically fixes most formatting issues that cause CI failures.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 def run_command(cmd, description):
-    """Run a command and report results"""
+    """Run a command, streaming its output line by line
+
+    Streaming instead of capture_output keeps peak memory bounded and
+    shows progress while the tool is still working on a large tree.
+    """
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
+        process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in process.stdout:
+            print(f"   {line}", end="")
+        returncode = process.wait()
+        if returncode == 0:
             print(f"✅ {description} completed successfully")
-            if result.stdout.strip():
-                print(f"   Output: {result.stdout.strip()}")
         else:
-            print(f"⚠️ {description} had issues:")
-            print(f"   {result.stderr.strip()}")
-        return result.returncode == 0
+            print(f"⚠️ {description} had issues (exit code {returncode})")
+        return returncode == 0
     except Exception as e:
         print(f"❌ Error running {description}: {e}")
         return False
@@ -44,7 +56,9 @@ def main():
     print("\n" + "=" * 50)
     print(f"✅ {success_count}/{len(commands)} formatting tasks completed")
 
-    # Check results
+    # Check results. Unlike the fix commands above (which rewrite the same
+    # files and must stay sequential), these are read-only and independent,
+    # so they run concurrently — subprocess waits release the GIL.
     print("\n🔍 Checking results...")
     check_commands = [
         ("black --check .", "Black formatting check"),
@@ -52,9 +66,16 @@ def main():
         ("flake8 . --statistics", "Flake8 style check"),
     ]
 
+    with ThreadPoolExecutor(max_workers=len(check_commands)) as executor:
+        check_results = list(
+            executor.map(
+                lambda pair: subprocess.run(pair[0], shell=True, capture_output=True, text=True),
+                check_commands,
+            )
+        )
+
     all_passed = True
-    for cmd, desc in check_commands:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    for (cmd, desc), result in zip(check_commands, check_results):
         if result.returncode == 0:
             print(f"✅ {desc} passed")
         else:
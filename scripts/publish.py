@@ -6,12 +6,26 @@ Automates the build, test, and publish process to PyPI.
 """
 
 import argparse
+import importlib.util
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Version pattern compiled once per script run instead of per call
+_VER_RE = re.compile(r'version = "([^"]+)"')
+
+
+@lru_cache(maxsize=8)
+def _read(path):
+    """Read a file once per invocation; version lookup and bump share the content"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
 
 def run_command(command, check=True, capture_output=False):
     """Run command and handle results"""
@@ -38,10 +52,7 @@ def run_command(command, check=True, capture_output=False):
 def get_current_version():
     """Get current version number"""
     try:
-        with open("pyproject.toml", "r", encoding="utf-8") as f:
-            content = f.read()
-
-        match = re.search(r'version = "([^"]+)"', content)
+        match = _VER_RE.search(_read("pyproject.toml"))
         if match:
             return match.group(1)
         else:
@@ -52,28 +63,32 @@ def get_current_version():
         return None
 
 
+def _replace_version_line(path, prefix, replacement):
+    """Rewrite the single line starting with prefix, leaving the rest untouched
+
+    Only the version line changes, so a line-level replace beats running a
+    regex substitution over the whole file; the first match wins.
+    """
+    lines = _read(path).splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if line.lstrip().startswith(prefix):
+            lines[i] = replacement + "\n"
+            break
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
 def update_version(new_version):
     """Update version number"""
     try:
-        # Update pyproject.toml
-        with open("pyproject.toml", "r", encoding="utf-8") as f:
-            content = f.read()
-
-        content = re.sub(r'version = "[^"]+"', f'version = "{new_version}"', content)
-
-        with open("pyproject.toml", "w", encoding="utf-8") as f:
-            f.write(content)
+        # Update pyproject.toml (content already cached by get_current_version)
+        _replace_version_line("pyproject.toml", "version =", f'version = "{new_version}"')
 
         # Update __init__.py
         init_file = "lib/shadowai/__init__.py"
         if os.path.exists(init_file):
-            with open(init_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            content = re.sub(r'__version__ = "[^"]+"', f'__version__ = "{new_version}"', content)
-
-            with open(init_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            _replace_version_line(init_file, "__version__ =", f'__version__ = "{new_version}"')
 
         print(f"✅ Version updated to: {new_version}")
         return True
@@ -87,9 +102,9 @@ def clean_build():
     """Clean build files"""
     print("🧹 Cleaning build files...")
 
-    dirs_to_clean = ["build", "dist", "*.egg-info"]
-    for dir_pattern in dirs_to_clean:
-        run_command(f"rm -rf {dir_pattern}", check=False)
+    # In-process removal: no shell forks, and it works on Windows too
+    for target in ["build", "dist", *Path(".").glob("*.egg-info")]:
+        shutil.rmtree(target, ignore_errors=True)
 
     print("✅ Build files cleaned")
 
@@ -103,13 +118,21 @@ def check_code_quality():
     run_command("black lib/ example/ scripts/")
     run_command("isort lib/ example/ scripts/")
 
-    # Check code style
-    print("🎯 Checking code style...")
-    run_command("flake8 lib/ --max-line-length=100 --ignore=E203,W503")
-
-    # Type checking
-    print("🔬 Type checking...")
-    run_command("mypy lib/ --ignore-missing-imports", check=False)
+    # Check code style and types concurrently — both are read-only, so the
+    # wall time is max(flake8, mypy) instead of their sum
+    print("🎯 Checking code style and types...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        flake8_future = executor.submit(
+            run_command, "flake8 lib/ --max-line-length=100 --ignore=E203,W503"
+        )
+        # Incremental sqlite cache: repeat runs only re-check changed modules
+        mypy_future = executor.submit(
+            run_command,
+            "mypy lib/ --ignore-missing-imports --incremental --sqlite-cache",
+            False,
+        )
+        flake8_future.result()
+        mypy_future.result()
 
     print("✅ Code quality check completed")
 
@@ -120,11 +143,20 @@ def run_tests():
 
     # Check if tests exist
     if os.path.exists("tests"):
-        run_command("python -m pytest tests/ -v")
+        test_dir = "tests/"
     elif os.path.exists("example/test"):
-        run_command("python -m pytest example/test/ -v")
+        test_dir = "example/test/"
     else:
         print("⚠️ No test files found, skipping tests")
+        return
+
+    # -n auto shards tests across CPU cores, but only when pytest-xdist is
+    # actually installed — otherwise pytest rejects the flag and zero tests
+    # would gate the release
+    xdist = "-n auto " if importlib.util.find_spec("xdist") else ""
+    result = subprocess.run(f"python -m pytest {test_dir} {xdist}-v", shell=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Test suite failed (exit code {result.returncode})")
 
     print("✅ Tests completed")
 
@@ -136,8 +168,12 @@ def build_package():
     # Clean previous builds
     clean_build()
 
-    # Build package
-    run_command("python -m build")
+    # Build package — uv's Rust-based builder is markedly faster when
+    # installed, with python -m build as the portable fallback
+    if shutil.which("uv"):
+        run_command("uv build")
+    else:
+        run_command("python -m build")
 
     print("✅ Package built successfully")
 
@@ -181,25 +217,27 @@ def validate_dependencies():
     """Validate dependencies"""
     print("📋 Validating dependencies...")
 
-    # Check Python modules that can be run with -m
-    required_modules = {"build": ["python", "-m", "build", "--help"]}
-    # Check regular command-line tools
-    required_tools = ["twine", "black", "isort", "flake8"]
-    missing_tools = []
-
-    # Check modules first
-    for module, cmd in required_modules.items():
+    # Each probe is an independent read-only subprocess built as an argv
+    # list (no shell fork), so they all run concurrently
+    checks = {
+        "build": [sys.executable, "-m", "build", "--help"],
+        "twine": ["twine", "--help"],
+        "black": ["black", "--help"],
+        "isort": ["isort", "--help"],
+        "flake8": ["flake8", "--help"],
+    }
+
+    def probe(cmd):
         try:
             subprocess.run(cmd, capture_output=True, check=True)
+            return True
         except (subprocess.CalledProcessError, FileNotFoundError):
-            missing_tools.append(module)
+            return False
 
-    # Check regular tools
-    for tool in required_tools:
-        try:
-            subprocess.run([tool, "--help"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            missing_tools.append(tool)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = dict(zip(checks, executor.map(probe, checks.values())))
+
+    missing_tools = [tool for tool, ok in results.items() if not ok]
 
     if missing_tools:
         print(f"❌ Missing required tools: {', '.join(missing_tools)}")
@@ -5,23 +5,73 @@ ShadowAI Quick Start Script
 Helps users quickly experience ShadowAI functionality.
 """
 
+import importlib
 import json
 import os
+import site
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
+
+# Packages the demos need, mapped import name -> distribution name (they
+# differ for PyYAML); checked before anything runs
+_REQUIRED_PACKAGES = {"agno": "agno", "pydantic": "pydantic", "yaml": "PyYAML"}
+
+# Banner separators built once instead of re-multiplied per menu iteration
+_EQ20, _EQ30, _EQ35, _EQ40 = "=" * 20, "=" * 30, "=" * 35, "=" * 40
+_DASH25, _DASH30, _DASH35, _DASH40 = "-" * 25, "-" * 30, "-" * 35, "-" * 40
+
+# Project paths resolved once at import. addsitedir appends lib/ (and
+# processes any .pth files) rather than prepending, so imports of
+# unrelated modules keep hitting stdlib/site-packages first.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LIB_PATH = os.path.join(_PROJECT_ROOT, "lib")
+if os.path.isdir(_LIB_PATH):
+    site.addsitedir(_LIB_PATH)
+
+
+class _LazyModule:
+    """Proxy that imports the named module on first attribute access
+
+    The demo menu only needs the subtree backing the option the user
+    actually picks, so each module's top-level code runs on first use and
+    is reused (via sys.modules) on later menu iterations.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+_shadow_ai = _LazyModule("shadow_ai")
+_rules = _LazyModule("shadow_ai.rules")
+_combinations = _LazyModule("shadow_ai.rules.combinations")
+_packages = _LazyModule("shadow_ai.rules.packages")
 
 
 def check_dependencies():
     """Check if dependencies are installed"""
     print("🔍 Checking dependencies...")
 
-    required_packages = ["agno", "pydantic", "yaml"]
     missing_packages = []
 
-    for package in required_packages:
+    # A module already in sys.modules is trivially present — warm re-runs
+    # (test harnesses, IPython) skip the metadata read entirely. Otherwise
+    # distribution() reads only the installed wheel's metadata file, so
+    # presence is verified without executing any package code.
+    for package, dist_name in _REQUIRED_PACKAGES.items():
+        if package in sys.modules:
+            print(f"✅ {package} installed")
+            continue
         try:
-            __import__(package)
+            distribution(dist_name)
             print(f"✅ {package} installed")
-        except ImportError:
+        except PackageNotFoundError:
             missing_packages.append(package)
             print(f"❌ {package} not installed")
 
@@ -37,86 +87,97 @@ def check_api_key():
     """Check API key"""
     print("\n🔑 Checking API key...")
 
-    if os.getenv("OPENAI_API_KEY"):
+    env = os.environ
+    if env.get("OPENAI_API_KEY"):
         print("✅ OPENAI_API_KEY is set")
         return "openai"
-    elif os.getenv("ANTHROPIC_API_KEY"):
+    elif env.get("ANTHROPIC_API_KEY"):
         print("✅ ANTHROPIC_API_KEY is set")
         return "anthropic"
     else:
-        print("⚠️ No API key set")
-        print("Please set one of the following environment variables:")
-        print("  export OPENAI_API_KEY=your_openai_key")
-        print("  export ANTHROPIC_API_KEY=your_anthropic_key")
+        print(
+            "⚠️ No API key set\n"
+            "Please set one of the following environment variables:\n"
+            "  export OPENAI_API_KEY=your_openai_key\n"
+            "  export ANTHROPIC_API_KEY=your_anthropic_key"
+        )
         return None
 
 
-def demonstrate_basic_usage():
-    """Demonstrate basic usage"""
-    print("\n🚀 Basic Usage Demo")
-    print("=" * 30)
+def _flush(buf):
+    """Emit buffered lines with a single stdout write
 
-    # Add project path
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    lib_path = os.path.join(project_root, "lib")
-    if lib_path not in sys.path:
-        sys.path.insert(0, lib_path)
+    One write syscall per example block instead of one per print keeps
+    slow TTYs and piped output from dominating the demo's wall time.
+    """
+    sys.stdout.write("\n".join(buf) + "\n")
+    buf.clear()
 
-    try:
-        from shadow_ai import ShadowAI
-        from shadow_ai.rules import email_rule, first_name_rule
-        from shadow_ai.rules.packages import person_package
-
-        # Initialize ShadowAI
-        shadow_ai = ShadowAI()
 
-        # Example 1: Generate email
-        print("\n📧 Example 1: Generate email")
-        print("-" * 25)
-        try:
-            result = shadow_ai.generate(email_rule, format_output=False)
-            print(f"Generated email: {result}")
-        except Exception as e:
-            print(f"❌ Email generation failed: {e}")
-
-        # Example 2: Generate name
-        print("\n👤 Example 2: Generate name")
-        print("-" * 25)
-        try:
-            result = shadow_ai.generate(first_name_rule, format_output=False)
-            print(f"Generated name: {result}")
-        except Exception as e:
-            print(f"❌ Name generation failed: {e}")
-
-        # Example 3: Generate using strings
-        print("\n🎯 Example 3: String-based generation")
-        print("-" * 35)
-        try:
-            result = shadow_ai.generate("phone", format_output=False)
-            print(f"Generated phone: {result}")
+def demonstrate_basic_usage():
+    """Demonstrate basic usage"""
+    print(f"\n🚀 Basic Usage Demo\n{_EQ30}")
 
-            result = shadow_ai.generate("company_name", format_output=False)
-            print(f"Generated company: {result}")
-        except Exception as e:
-            print(f"❌ String-based generation failed: {e}")
+    try:
+        # Initialize ShadowAI (first attribute access triggers the import)
+        shadow_ai = _shadow_ai.ShadowAI()
+        email_rule = _rules.email_rule
+        first_name_rule = _rules.first_name_rule
+        person_package = _packages.person_package
+
+        buf = []
+
+        def string_based():
+            phone = shadow_ai.generate("phone", format_output=False)
+            company = shadow_ai.generate("company_name", format_output=False)
+            return f"Generated phone: {phone}\nGenerated company: {company}"
+
+        # (header, separator, failure label, work) for each example
+        tasks = [
+            (
+                "\n📧 Example 1: Generate email",
+                _DASH25,
+                "Email generation",
+                lambda: f"Generated email: {shadow_ai.generate(email_rule, format_output=False)}",
+            ),
+            (
+                "\n👤 Example 2: Generate name",
+                _DASH25,
+                "Name generation",
+                lambda: f"Generated name: {shadow_ai.generate(first_name_rule, format_output=False)}",
+            ),
+            (
+                "\n🎯 Example 3: String-based generation",
+                _DASH35,
+                "String-based generation",
+                string_based,
+            ),
+            (
+                "\n📦 Example 4: Generate using rule package",
+                _DASH40,
+                "Package generation",
+                lambda: f"Generated person: {shadow_ai.generate(person_package, format_output=False)}",
+            ),
+            (
+                "\n🔄 Example 5: Batch generation",
+                _DASH30,
+                "Batch generation",
+                lambda: f"Generated multiple people: {shadow_ai.generate(person_package, count=2, format_output=False)}",
+            ),
+        ]
 
-        # Example 4: Generate using rule package
-        print("\n📦 Example 4: Generate using rule package")
-        print("-" * 40)
-        try:
-            result = shadow_ai.generate(person_package, format_output=False)
-            print(f"Generated person: {result}")
-        except Exception as e:
-            print(f"❌ Package generation failed: {e}")
-
-        # Example 5: Batch generation
-        print("\n🔄 Example 5: Batch generation")
-        print("-" * 30)
-        try:
-            result = shadow_ai.generate(person_package, count=2, format_output=False)
-            print(f"Generated multiple people: {result}")
-        except Exception as e:
-            print(f"❌ Batch generation failed: {e}")
+        # The examples are independent, network-bound agent calls, so they
+        # run concurrently; results are printed in the original order.
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(work) for *_, work in tasks]
+            for (header, separator, label, _), future in zip(tasks, futures):
+                buf.append(header)
+                buf.append(separator)
+                try:
+                    buf.append(future.result())
+                except Exception as e:
+                    buf.append(f"❌ {label} failed: {e}")
+                _flush(buf)
 
         print("\n✅ Basic demos completed!")
 
@@ -129,100 +190,70 @@ def demonstrate_basic_usage():
 
 def show_available_rules():
     """Show available pre-built rules"""
-    print("\n📚 Available Pre-built Rules")
-    print("=" * 35)
-
-    # Add project path
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    lib_path = os.path.join(project_root, "lib")
-    if lib_path not in sys.path:
-        sys.path.insert(0, lib_path)
+    print(f"\n📚 Available Pre-built Rules\n{_EQ35}")
 
     try:
-        from shadow_ai.rules import (
-            address_rule,
-            age_rule,
-            company_rule,
-            email_rule,
-            first_name_rule,
-            last_name_rule,
-            phone_rule,
-        )
-        from shadow_ai.rules.combinations import (
-            full_address_combination,
-            full_name_combination,
-        )
-        from shadow_ai.rules.packages import (
-            company_package,
-            person_package,
-            user_package,
-        )
-
         print("\n🔧 Basic Rules:")
-        rules = [
-            ("email_rule", email_rule),
-            ("first_name_rule", first_name_rule),
-            ("last_name_rule", last_name_rule),
-            ("age_rule", age_rule),
-            ("phone_rule", phone_rule),
-            ("address_rule", address_rule),
-            ("company_rule", company_rule),
+        rule_names = [
+            "email_rule",
+            "first_name_rule",
+            "last_name_rule",
+            "age_rule",
+            "phone_rule",
+            "address_rule",
+            "company_rule",
         ]
 
-        for name, rule in rules:
-            print(f"  • {name}: {rule.description}")
+        for name in rule_names:
+            print(f"  • {name}: {getattr(_rules, name).description}")
 
         print("\n🔗 Rule Combinations:")
-        combinations = [
-            ("full_name_combination", full_name_combination),
-            ("full_address_combination", full_address_combination),
-        ]
+        combination_names = ["full_name_combination", "full_address_combination"]
 
-        for name, combo in combinations:
-            print(f"  • {name}: {combo.description}")
+        for name in combination_names:
+            print(f"  • {name}: {getattr(_combinations, name).description}")
 
         print("\n📦 Rule Packages:")
-        packages = [
-            ("person_package", person_package),
-            ("company_package", company_package),
-            ("user_package", user_package),
-        ]
+        package_names = ["person_package", "company_package", "user_package"]
 
-        for name, package in packages:
-            print(f"  • {name}: {package.description}")
+        for name in package_names:
+            print(f"  • {name}: {getattr(_packages, name).description}")
 
     except ImportError as e:
         print(f"❌ Failed to load rules: {e}")
 
 
+# Menu text built once instead of four prints per loop iteration
+_MENU = "\nChoose an option:\n1. Basic usage demo\n2. Show available rules\n3. Exit\n"
+_DISPATCH = {
+    "1": demonstrate_basic_usage,
+    "2": show_available_rules,
+}
+
+
 def interactive_demo():
     """Interactive demo menu"""
-    print("\n🎮 Interactive Demo")
-    print("=" * 20)
+    print(f"\n🎮 Interactive Demo\n{_EQ20}")
 
     while True:
-        print("\nChoose an option:")
-        print("1. Basic usage demo")
-        print("2. Show available rules")
-        print("3. Exit")
+        sys.stdout.write(_MENU)
 
         choice = input("\nEnter your choice (1-3): ").strip()
 
-        if choice == "1":
-            demonstrate_basic_usage()
-        elif choice == "2":
-            show_available_rules()
-        elif choice == "3":
+        if choice == "3":
             print("👋 Goodbye!")
             break
+
+        action = _DISPATCH.get(choice)
+        if action:
+            action()
         else:
             print("❌ Invalid choice. Please enter 1, 2, or 3.")
 
 
 def main():
     """Main function"""
-    print("🎊 Welcome to ShadowAI Quick Start!")
-    print("=" * 40)
+    print(f"🎊 Welcome to ShadowAI Quick Start!\n{_EQ40}")
 
     # Check dependencies
     if not check_dependencies():
@@ -238,10 +269,12 @@ def main():
     print(f"\n✅ Environment setup complete! Using {api_provider} API.")
 
     # Show quick help
-    print("\n💡 Quick Tips:")
-    print("  • Make sure you're running from the project root directory")
-    print("  • All examples use the ShadowAI library from lib/ directory")
-    print("  • Generated data may vary each time due to AI randomness")
+    print(
+        "\n💡 Quick Tips:\n"
+        "  • Make sure you're running from the project root directory\n"
+        "  • All examples use the ShadowAI library from lib/ directory\n"
+        "  • Generated data may vary each time due to AI randomness"
+    )
 
     # Start interactive demo
     interactive_demo()
@@ -8,42 +8,75 @@ This script helps automate the release process by:
 3. Pushing to GitHub (which triggers the release workflow)
 """
 
+import os
 import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Patterns compiled once at import instead of re-parsed per call
+_VERSION_RE = re.compile(r'version = "([^"]+)"')
+_VERSION_FMT_RE = re.compile(r"^\d+\.\d+\.\d+(-\w+)?$")
 
-def get_current_version():
+_PYPROJECT = Path("pyproject.toml")
+
+# Release commands must never sit on a credential or signing prompt; with
+# no terminal prompt and a closed stdin, git errors out immediately instead
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+def get_current_version(content=None):
     """Get current version from pyproject.toml"""
-    pyproject_path = Path("pyproject.toml")
-    content = pyproject_path.read_text()
-    match = re.search(r'version = "([^"]+)"', content)
+    if content is None:
+        content = _PYPROJECT.read_text(encoding="utf-8")
+    match = _VERSION_RE.search(content)
     if match:
         return match.group(1)
     raise ValueError("Could not find version in pyproject.toml")
 
 
-def update_version(new_version):
+def update_version(new_version, content=None):
     """Update version in pyproject.toml"""
-    pyproject_path = Path("pyproject.toml")
-    content = pyproject_path.read_text()
-
-    # Update version
-    content = re.sub(r'version = "[^"]+"', f'version = "{new_version}"', content)
-
-    pyproject_path.write_text(content)
+    if content is None:
+        content = _PYPROJECT.read_text(encoding="utf-8")
+    tmp_path = Path("pyproject.toml.tmp")
+
+    # Write the already-loaded content line by line into a temp file and
+    # rename it into place: only the version line is touched, and
+    # os.replace makes the edit atomic, so an interrupt can't leave a
+    # half-written pyproject.toml behind.
+    replaced = False
+    with tmp_path.open("w", encoding="utf-8") as dst:
+        for line in content.splitlines(keepends=True):
+            if not replaced and line.startswith("version = "):
+                line = _VERSION_RE.sub(f'version = "{new_version}"', line, count=1)
+                replaced = True
+            dst.write(line)
+
+    os.replace(tmp_path, _PYPROJECT)
     print(f"✅ Updated version to {new_version} in pyproject.toml")
 
 
-def run_command(cmd, check=True):
-    """Run shell command"""
-    print(f"🔄 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+def run_command(argv, check=True, capture=False):
+    """Run a command given as an argv list
+
+    Passing a list skips the /bin/sh fork and shell parsing that
+    shell=True paid on every call. Output is captured only when the
+    caller reads it; everything else (notably git push progress)
+    streams straight to the inherited stdout/stderr.
+    """
+    print(f"🔄 Running: {' '.join(argv)}")
+    if capture:
+        result = subprocess.run(
+            argv, capture_output=True, text=True, stdin=subprocess.DEVNULL, env=_GIT_ENV
+        )
+    else:
+        result = subprocess.run(argv, stdin=subprocess.DEVNULL, env=_GIT_ENV)
 
     if check and result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
-        print(f"Error: {result.stderr}")
+        print(f"❌ Command failed: {' '.join(argv)}")
+        if capture:
+            print(f"Error: {result.stderr}")
         sys.exit(1)
 
     return result
@@ -54,19 +87,20 @@ def create_and_push_tag(version):
     tag_name = f"v{version}"
 
     # Add and commit changes
-    run_command("git add pyproject.toml")
-    run_command(f'git commit -m "Bump version to {version}"')
+    run_command(["git", "add", "pyproject.toml"])
+    run_command(["git", "commit", "-m", f"Bump version to {version}"])
 
     # Create tag
-    run_command(f'git tag -a {tag_name} -m "Release {tag_name}"')
+    run_command(["git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"])
 
-    # Push changes and tag
-    run_command("git push origin main")
-    run_command(f"git push origin {tag_name}")
+    # Push branch and tag in one atomic round trip instead of two pushes
+    run_command(["git", "push", "--atomic", "origin", "main", tag_name])
 
-    print(f"✅ Created and pushed tag: {tag_name}")
-    print(f"🚀 Release workflow will be triggered automatically!")
-    print(f"📦 Check: https://github.com/KevinZhang19870314/shadowai/actions")
+    print(
+        f"✅ Created and pushed tag: {tag_name}\n"
+        "🚀 Release workflow will be triggered automatically!\n"
+        "📦 Check: https://github.com/KevinZhang19870314/shadowai/actions"
+    )
 
 
 def main():
@@ -76,25 +110,37 @@ def main():
         sys.exit(1)
 
     new_version = sys.argv[1]
-    current_version = get_current_version()
-
-    print(f"📦 ShadowAI Release Script")
-    print(f"Current version: {current_version}")
-    print(f"New version: {new_version}")
 
-    # Validate version format
-    if not re.match(r"^\d+\.\d+\.\d+(-\w+)?$", new_version):
+    # Cheap validations first: bad input fails before any file read or
+    # git process spawn
+    if not _VERSION_FMT_RE.match(new_version):
         print("❌ Invalid version format. Use: x.y.z or x.y.z-suffix")
         sys.exit(1)
 
-    # Check git status
-    result = run_command("git status --porcelain", check=False)
+    # One read serves both the version lookup and the bump below
+    content = _PYPROJECT.read_text(encoding="utf-8")
+    current_version = get_current_version(content)
+
+    print(
+        f"📦 ShadowAI Release Script\n"
+        f"Current version: {current_version}\n"
+        f"New version: {new_version}"
+    )
+
+    if new_version == current_version:
+        print("❌ Version unchanged. Nothing to release.")
+        sys.exit(1)
+
+    # Check git status; skipping untracked files avoids a full worktree walk
+    result = run_command(
+        ["git", "status", "--porcelain", "--untracked-files=no"], check=False, capture=True
+    )
     if result.stdout.strip():
         print("❌ Working directory is not clean. Please commit changes first.")
         sys.exit(1)
 
     # Update version
-    update_version(new_version)
+    update_version(new_version, content)
 
     # Create and push tag
     create_and_push_tag(new_version)